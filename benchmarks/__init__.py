@@ -0,0 +1,5 @@
+"""Benchmarks of maliang.
+
+Each module can be run directly, e.g. `python -m benchmarks.bench_dispatch`.
+They need a display to run because real windows are created.
+"""
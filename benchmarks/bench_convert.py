@@ -0,0 +1,33 @@
+# pylint: disable=all
+
+"""Cost of parsing color strings with and without the converter caches."""
+
+import timeit
+
+from maliang.color import convert
+
+
+def uncached(value: str) -> tuple[int, int, int]:
+    if value.startswith("#"):
+        return convert.hex_to_rgb.__wrapped__(convert.fix_hex_length.__wrapped__(value))
+
+    return convert.name_to_rgb.__wrapped__(value)
+
+
+def bench(value: str, number: int = 100_000) -> tuple[float, float]:
+    convert.cache_clear()
+    cached_time = min(timeit.repeat(lambda: convert.str_to_rgb(value), number=number, repeat=5))
+    uncached_time = min(timeit.repeat(lambda: uncached(value), number=number, repeat=5))
+    return cached_time / number, uncached_time / number
+
+
+def main() -> None:
+    print(f"{'color':>10} {'cached (us)':>12} {'uncached (us)':>14}")
+
+    for value in "#ABCDEF", "#ABC", "royalblue":
+        cached_time, uncached_time = bench(value)
+        print(f"{value:>10} {cached_time*1e6:>12.3f} {uncached_time*1e6:>14.3f}")
+
+
+if __name__ == "__main__":
+    main()
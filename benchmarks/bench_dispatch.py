@@ -0,0 +1,41 @@
+# pylint: disable=all
+
+"""Cost of dispatching pointer events with and without the spatial index."""
+
+import timeit
+import tkinter
+
+from maliang.core import containers
+from maliang.standard import widgets
+
+
+def bench(count: int, spatial_index: bool, number: int = 200) -> float:
+    with containers.Tk() as tk:
+        cv = containers.Canvas(tk, spatial_index=spatial_index)
+        cv.place(width=1280, height=720)
+
+        columns = int(count ** 0.5) + 1
+
+        for i in range(count):
+            widgets.Button(cv, (i % columns * 50, i // columns * 30), (40, 20))
+
+        event = tkinter.Event()
+
+        def motion() -> None:
+            event.x, event.y = 25, 15
+            cv.on_motion(event, "<Motion>")
+
+        return timeit.timeit(motion, number=number) / number
+
+
+def main() -> None:
+    print(f"{'widgets':>8} {'linear (ms)':>12} {'indexed (ms)':>13}")
+
+    for count in 100, 1_000, 10_000:
+        linear = bench(count, False) * 1000
+        indexed = bench(count, True) * 1000
+        print(f"{count:>8} {linear:>12.4f} {indexed:>13.4f}")
+
+
+if __name__ == "__main__":
+    main()
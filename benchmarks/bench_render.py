@@ -0,0 +1,75 @@
+# pylint: disable=all
+
+"""Tcl calls per frame when modifying a large nested widget, with and without
+deferred rendering.
+
+Moving the widget is a single command on its group tag, which is not deferred.
+Moving its elements and changing their colors modify the items one by one,
+which are batched by deferred rendering."""
+
+from maliang.core import containers
+from maliang.standard import widgets
+
+
+class CountingTk:
+    """Proxy of the Tcl interpreter that counts the calls."""
+
+    def __init__(self, tk) -> None:
+        self._tk = tk
+        self.count = 0
+
+    def call(self, *args):
+        self.count += 1
+        return self._tk.call(*args)
+
+    def eval(self, script):
+        self.count += 1
+        return self._tk.eval(script)
+
+    def __getattr__(self, name):
+        return getattr(self._tk, name)
+
+
+def bench(deferred_rendering: bool, frames: int = 30) -> tuple[float, float]:
+    with containers.Tk() as tk:
+        cv = containers.Canvas(tk, deferred_rendering=deferred_rendering)
+        cv.place(width=1280, height=720)
+
+        parent = widgets.Button(cv, (0, 0), (400, 400))
+
+        for i in range(50):
+            widgets.Button(parent, (i % 10 * 40, i // 10 * 40), (40, 40))
+
+        elements = [element for widget in parent._descendants() for element in widget.elements]
+        cv.update()
+        cv.tk = counter = CountingTk(cv.tk)
+
+        for _ in range(frames):
+            for _ in range(5):  # several moves are issued in a single frame
+                parent.move(1, 1)
+            cv.update_idletasks()
+
+        group, counter.count = counter.count / frames, 0
+
+        for frame in range(frames):
+            for _ in range(5):
+                for element in elements:
+                    element.move(1, 1)
+            for widget in parent.widgets:
+                widget.update("hover" if frame % 2 else "normal", gradient_animation=False)
+            cv.update_idletasks()
+
+        cv.tk = counter._tk
+        return group, counter.count / frames
+
+
+def main() -> None:
+    print(f"{'mode':>10} {'group move':>12} {'element moves':>15}")
+
+    for name, deferred_rendering in (("immediate", False), ("deferred", True)):
+        group, elements = bench(deferred_rendering)
+        print(f"{name:>10} {group:>12.1f} {elements:>15.1f}")
+
+
+if __name__ == "__main__":
+    main()
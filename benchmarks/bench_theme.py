@@ -0,0 +1,48 @@
+# pylint: disable=all
+
+"""Time until the visible widgets show the new theme and time until the whole
+canvas is updated, with and without theme time slices."""
+
+import time
+
+from maliang.core import configs, containers
+from maliang.standard import widgets
+from maliang.theme import manager
+
+
+def bench(theme_time_slice: int, count: int = 3000) -> tuple[float, float]:
+    with containers.Tk() as tk:
+        manager.remove_event(tk.theme)  # Only the canvas is timed
+        cv = containers.Canvas(tk, theme_time_slice=theme_time_slice)
+        cv.place(width=1280, height=720)
+
+        for i in range(count):
+            widgets.Button(cv, (i % 10 * 120, i // 10 * 40), (110, 30), text=str(i))
+
+        cv.update()
+        done = []
+
+        manager.set_color_mode("dark")
+        start = time.perf_counter()
+        cv.theme("dark", callback=lambda: done.append(time.perf_counter() - start))
+        first = time.perf_counter() - start  # No idle callback has run yet
+
+        while not done:
+            tk.update()
+
+        manager.set_color_mode("light")
+        return first, done[0]
+
+
+def main() -> None:
+    configs.Env.gradient_animation = False
+    manager.set_color_mode("light")
+    print(f"{'mode':>10} {'visible (ms)':>14} {'total (ms)':>12}")
+
+    for name, theme_time_slice in (("sync", 0), ("sliced", 8)):
+        first, total = bench(theme_time_slice)
+        print(f"{name:>10} {first*1000:>14.1f} {total*1000:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
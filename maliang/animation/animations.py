@@ -19,7 +19,11 @@ __all__ = [
 ]
 
 import collections.abc
+import functools
+import math
+import time
 import tkinter
+import traceback
 import typing
 import warnings
 
@@ -28,6 +32,105 @@ from ..core import configs, containers, virtual
 from . import controllers
 
 
+class _FrameClock:
+    """A clock that drives all the animations with a single timer.
+
+    Each tick advances every active animation according to the elapsed time,
+    so the frames that are late are collapsed into one step instead of being
+    queued.
+    """
+
+    def __init__(self) -> None:
+        self.animations: dict[Animation, None] = {}  # ordered set
+
+        self._task: str | None = None
+        self._root: tkinter.Tk | None = None
+        self._ticking: bool = False
+
+    def __contains__(self, animation: Animation) -> bool:
+        return animation in self.animations
+
+    def add(self, animation: Animation) -> None:
+        """Add an animation to be driven by the clock.
+
+        * `animation`: the animation
+        """
+        if self._root is not configs.Env.root:
+            # The timer and animations of the previous root are invalid now
+            self.animations.clear()
+            self._task, self._root = None, configs.Env.root
+
+        self.animations[animation] = None
+
+        if self._task is None and not self._ticking:
+            self._schedule(time.perf_counter())
+
+    def remove(self, animation: Animation) -> None:
+        """Remove an animation from the clock.
+
+        * `animation`: the animation
+        """
+        self.animations.pop(animation, None)
+
+        if not self.animations and self._task is not None:
+            self._root.after_cancel(self._task)
+            self._task = None
+
+    def _schedule(self, now: float) -> None:
+        """Schedule the next tick at the time when the next frame is due.
+
+        * `now`: the current time
+        """
+        due = min(animation._next_due() for animation in self.animations)
+        self._task = self._root.after(max(round((due-now) * 1000), 1), self._tick)
+
+    def _tick(self) -> None:
+        """Advance all the animations."""
+        self._task, self._ticking = None, True
+        now = time.perf_counter()
+
+        for animation in tuple(self.animations):
+            try:
+                animation._advance(now)
+            except Exception as exc:  # pylint: disable=W0718
+                traceback.print_exception(exc)
+
+        self._ticking = False
+
+        if self.animations:
+            self._schedule(now)
+
+
+_clock = _FrameClock()
+
+# The animations that are running, keyed by what they modify
+_registry: dict[tuple[typing.Any, ...], Animation] = {}
+
+
+@functools.lru_cache(maxsize=256)
+def _get_gradient_colors(
+    first: tuple[int, int, int],
+    second: tuple[int, int, int],
+    total_frames: int,
+    controller: collections.abc.Callable[[float], float],
+) -> dict[float, str]:
+    """Return the hex codes of the colors of all frames of a gradient, keyed
+    by the percentages of the frames. The result is shared, do not modify it.
+
+    * `first`: the initial RGB code
+    * `second`: the ending RGB code
+    * `total_frames`: the number of frames
+    * `controller`: a function that controls the animation process
+    """
+    colors: dict[float, str] = {}
+
+    for i in range(1, total_frames + 1):
+        percentage = controller(i / total_frames)
+        colors[percentage] = convert.rgb_to_hex(rgb.transition(first, second, percentage))
+
+    return colors
+
+
 class Animation:
     """Base animation class."""
 
@@ -64,6 +167,18 @@ class Animation:
         self._tasks: list[str] = []
         self._count: int = repeat
 
+        self._start_time: float = 0
+        self._frame: int = 0
+        self._last_percentage: float = 0
+
+        self._frames_rendered: int = 0
+        self._frames_dropped: int = 0
+        self._max_lateness: float = 0
+
+        # Animations with the same key modify the same property of the same
+        # target, so the previous one is stopped when a new one starts
+        self.key: tuple[typing.Any, ...] | None = None
+
         if self._delay <= duration:
             self._total_frames, self._leave_ms = divmod(duration, self._delay)
         else:
@@ -72,13 +187,30 @@ class Animation:
     @property
     def active(self) -> bool:
         """Returns the active state of the animation."""
-        return bool(self._tasks)
+        return bool(self._tasks) or self in _clock
 
     @property
     def count(self) -> int:
         """Returns the number of loops remaining."""
         return self._count
 
+    @property
+    def frames_rendered(self) -> int:
+        """Returns the number of frames rendered by the shared clock."""
+        return self._frames_rendered
+
+    @property
+    def frames_dropped(self) -> int:
+        """Returns the number of frames collapsed by the shared clock because
+        they were late."""
+        return self._frames_dropped
+
+    @property
+    def max_lateness(self) -> float:
+        """Returns the worst lateness of the frames rendered by the shared
+        clock, in milliseconds."""
+        return self._max_lateness
+
     def _repeat(self) -> None:
         """Processing of the number of repetitions."""
         self._tasks.clear()
@@ -89,6 +221,12 @@ class Animation:
                 self._tasks.append(task)
         else:
             self._count = self.repeat
+            self._deregister()
+
+    def _deregister(self) -> None:
+        """Remove the animation from the running animations."""
+        if self.key is not None and _registry.get(self.key) is self:
+            del _registry[self.key]
 
     @typing.overload
     def start(self) -> None: ...
@@ -104,6 +242,18 @@ class Animation:
         if delay > 0:
             return configs.Env.root.after(delay, self.start)
 
+        if self.key is not None:
+            if (animation := _registry.get(self.key)) not in (None, self):
+                animation.stop()  # retarget from the current value
+
+            _registry[self.key] = self
+
+        if configs.Env.shared_clock:
+            self._start_time = time.perf_counter()
+            self._frame, self._last_percentage = 0, 0
+            _clock.add(self)
+            return None
+
         delay, last_percentage = 0, 0
 
         for i in range(1, self._total_frames + 1):
@@ -139,7 +289,9 @@ class Animation:
         while self._tasks:
             configs.Env.root.after_cancel(self._tasks.pop())
 
+        _clock.remove(self)
         self._count = self.repeat
+        self._deregister()
 
         return None
 
@@ -150,6 +302,57 @@ class Animation:
         """
         self._count = max(self._count-count, 0)
 
+    def _get_due(self, frame: int) -> float:
+        """Return the time when a frame is due, relative to the start time.
+
+        * `frame`: the index of the frame
+        """
+        return (frame*self._delay + min(frame, self._leave_ms)) / 1000
+
+    def _next_due(self) -> float:
+        """Return the time when the next frame is due."""
+        return self._start_time + self._get_due(self._frame + 1)
+
+    def _advance(self, now: float) -> None:
+        """Advance the animation to the current time, which is called by the
+        shared clock.
+
+        The progress is the one of the latest frame that is due at the elapsed
+        time, the frames that are late are collapsed into one step, and the
+        last frame always reaches the end of the animation.
+
+        * `now`: the current time
+        """
+        frame, elapsed = self._frame, now - self._start_time
+
+        while frame < self._total_frames and self._get_due(frame + 1) <= elapsed:
+            frame += 1
+
+        if frame == self._frame:
+            return
+
+        lateness = (elapsed - self._get_due(self._frame + 1)) * 1000
+        self._max_lateness = max(self._max_lateness, lateness)
+        self._frames_dropped += frame - self._frame - 1
+        self._frames_rendered += 1
+        self._frame = frame
+
+        # The same percentages as the timer, so precomputed frames can be used
+        percentage = self.controller(frame / self._total_frames)
+
+        self.command(percentage - self._last_percentage)
+
+        if self.derivation:
+            self._last_percentage = percentage
+
+        if frame == self._total_frames:
+            _clock.remove(self)
+
+            if self.end is not None:
+                self.end()
+
+            self._repeat()
+
 
 class MoveWindow(Animation):
     """Animation of moving the window."""
@@ -366,11 +569,14 @@ class GradientTkWidget(Animation):
 
         Animation.__init__(
             self, duration, lambda p: widget.configure(
-                {parameter: convert.rgb_to_hex(rgb.transition(c1, c2, p))}),
+                {parameter: self._colors.get(p) or convert.rgb_to_hex(rgb.transition(c1, c2, p))}),
             controller=controller, end=end, fps=fps, repeat=repeat,
             repeat_delay=repeat_delay, derivation=derivation,
         )
 
+        self.key = widget, parameter
+        self._colors = _get_gradient_colors(c1, c2, self._total_frames, controller)
+
 
 class GradientItem(Animation):
     """Animation of making the color of canvas item to be gradient."""
@@ -410,11 +616,14 @@ class GradientItem(Animation):
 
         Animation.__init__(
             self, duration, lambda p: canvas.itemconfigure(
-                item, {parameter: convert.rgb_to_hex(rgb.transition(c1, c2, p))}),
+                item, {parameter: self._colors.get(p) or convert.rgb_to_hex(rgb.transition(c1, c2, p))}),
             controller=controller, end=end, fps=fps, repeat=repeat,
             repeat_delay=repeat_delay, derivation=derivation,
         )
 
+        self.key = canvas, item, parameter
+        self._colors = _get_gradient_colors(c1, c2, self._total_frames, controller)
+
 
 class ScaleFontSize(Animation):
     """Animation of scaling the font size of `virtual.Text`."""
@@ -475,15 +684,22 @@ class ScaleFontSize(Animation):
         """
         if isinstance(sizes, (int, float)):
             sizes = -abs(sizes)
-            sizes = text.font.cget("size"), sizes - text.font.cget("size")
+            size = -abs(text.font.cget("size"))
+            sizes = size, sizes - size
         else:
             sizes = -abs(sizes[0]), -abs(sizes[1])
             sizes = sizes[0], sizes[1] - sizes[0]
 
+        def callback(p) -> None:
+            # The sizes are the actual sizes, which are set as sizes before zooming
+            ratios = getattr(text.widget.master, "ratios", (1, 1))
+            text.set_font(size=round((sizes[0] + sizes[1]*p)/math.sqrt(ratios[0]*ratios[1])))
+            text.update()
+
         Animation.__init__(
-            self, duration, lambda p: (
-                text.font.config(size=round(sizes[0] + sizes[1]*p)),
-                text.update()),
+            self, duration, callback,
             controller=controller, end=end, fps=fps, repeat=repeat,
             repeat_delay=repeat_delay, derivation=derivation,
         )
+
+        self.key = text, "size"
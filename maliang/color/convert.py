@@ -5,6 +5,9 @@
 * RGBA: tuple, (Red, Green, Blue, Alpha)
 * HEX: hexadecimal, such as '#ABCDEF' or '#12345678'
 * NAME: string, such as 'royalblue'
+
+The converters that parse strings are cached, see `cache_info` and
+`cache_clear`.
 """
 
 from __future__ import annotations
@@ -22,8 +25,13 @@ __all__ = [
     "rgb_to_name",
     "name_to_hex",
     "hex_to_name",
+    "nearest_name",
     "fix_hex_length",
     "str_to_rgb",
+    "rgb_to_hex_many",
+    "hex_to_rgb_many",
+    "cache_info",
+    "cache_clear",
     # Alias
     "rgb2hex",
     "hex2rgb",
@@ -40,12 +48,20 @@ __all__ = [
     "str2rgb",
 ]
 
+import collections.abc
 import colorsys
+import functools
 import math
+import typing
 
 from ..core import configs
 from . import colortable, rgb
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 
 def rgb_to_hex(value: tuple[int, int, int], /) -> str:
     """Convert a RGB code to a hexadecimal code.
@@ -55,6 +71,7 @@ def rgb_to_hex(value: tuple[int, int, int], /) -> str:
     return f"#{value[0]:02X}{value[1]:02X}{value[2]:02X}"
 
 
+@functools.lru_cache(maxsize=1024)
 def hex_to_rgb(value: str, /) -> tuple[int, int, int]:
     """Convert a hexadecimal code to a RGB code.
 
@@ -73,6 +90,7 @@ def rgba_to_hex(value: tuple[int, int, int, float], /) -> str:
     return f"#{value[0]:02X}{value[1]:02X}{value[2]:02X}{round(value[3]*255):02X}"
 
 
+@functools.lru_cache(maxsize=1024)
 def hex_to_rgba(value: str, /) -> tuple[int, int, int, float]:
     """Convert a hexadecimal code to a RGBA code.
 
@@ -140,10 +158,13 @@ def hex_to_hsl(value: str, /) -> tuple[float, float, float]:
     return rgb_to_hsl(hex_to_rgb(value))
 
 
+@functools.lru_cache(maxsize=1024)
 def name_to_rgb(value: str, /) -> tuple[int, int, int]:
     """Convert a color name to a RGB code.
 
     * `value`: a color name
+
+    The result is cached, including the one queried from Tk.
     """
     if rgb_code := colortable.MAPPING_TABLE.get(value.lower()):
         return rgb_code
@@ -156,13 +177,72 @@ def rgb_to_name(value: tuple[int, int, int], /) -> list[str]:
 
     * `value`: a RGB code
     """
-    str_list: list[str] = []
+    return list(_get_reverse_table().get(tuple(value), ()))
+
+
+@functools.lru_cache(maxsize=1)
+def _get_reverse_table() -> dict[tuple[int, int, int], tuple[str, ...]]:
+    """Return the mapping table from the RGB codes to the color names, which
+    is built when it is needed for the first time."""
+    table: dict[tuple[int, int, int], list[str]] = {}
 
     for name, rgb_code in colortable.MAPPING_TABLE.items():
-        if value == rgb_code:
-            str_list.append(name)
+        table.setdefault(rgb_code, []).append(name)
+
+    return {rgb_code: tuple(names) for rgb_code, names in table.items()}
+
 
-    return str_list
+# A node of k-d tree: (RGB code, left subtree, right subtree)
+_Node = tuple[tuple[int, int, int], "_Node | None", "_Node | None"]
+
+
+@functools.lru_cache(maxsize=1)
+def _get_kd_tree() -> _Node | None:
+    """Return the k-d tree of the RGB codes of the named colors, which is
+    built when it is needed for the first time."""
+    def build(points: list[tuple[int, int, int]], depth: int) -> _Node | None:
+        if not points:
+            return None
+
+        points.sort(key=lambda point: point[depth % 3])
+        middle = len(points) // 2
+
+        return (points[middle], build(points[:middle], depth+1),
+                build(points[middle+1:], depth+1))
+
+    return build(list(_get_reverse_table()), 0)
+
+
+def nearest_name(value: tuple[int, int, int], /) -> list[str]:
+    """Return the names of the named color which is the nearest to a RGB code.
+
+    * `value`: a RGB code
+    """
+    best: tuple[int, int, int] | None = None
+    best_distance = math.inf
+
+    def search(node: _Node | None, depth: int) -> None:
+        nonlocal best, best_distance
+
+        if node is None:
+            return
+
+        point, left, right = node
+        distance = sum((value[i] - point[i])**2 for i in range(3))
+
+        if distance < best_distance:
+            best, best_distance = point, distance
+
+        diff = value[depth % 3] - point[depth % 3]
+        near, far = (left, right) if diff < 0 else (right, left)
+        search(near, depth+1)
+
+        if diff*diff < best_distance:
+            search(far, depth+1)
+
+    search(_get_kd_tree(), 0)
+
+    return list(_get_reverse_table()[best])
 
 
 def name_to_hex(value: str, /) -> str:
@@ -181,6 +261,7 @@ def hex_to_name(value: str, /) -> list[str]:
     return rgb_to_name(hex_to_rgb(value))
 
 
+@functools.lru_cache(maxsize=1024)
 def fix_hex_length(value: str, /) -> str:
     """Fix the length of a hexadecimal code.
 
@@ -195,6 +276,7 @@ def fix_hex_length(value: str, /) -> str:
     return value
 
 
+@functools.lru_cache(maxsize=1024)
 def str_to_rgb(value: str, /) -> tuple[int, int, int]:
     """Convert a color name or a hexadecimal code to a RGB code.
 
@@ -206,6 +288,75 @@ def str_to_rgb(value: str, /) -> tuple[int, int, int]:
     return name_to_rgb(value)
 
 
+def rgb_to_hex_many(
+    values: collections.abc.Iterable[tuple[int, int, int]] | numpy.ndarray,
+    /,
+) -> list[str]:
+    """Convert lots of RGB codes to hexadecimal codes at once.
+
+    * `values`: RGB codes, an iterable or an array of shape (N, 3)
+
+    It is vectorized when `numpy` is installed. The channels that are not
+    integers are rounded.
+    """
+    if numpy is None:
+        return [f"#{round(r):02X}{round(g):02X}{round(b):02X}" for r, g, b in values]
+
+    array = numpy.asarray(values if isinstance(values, collections.abc.Sized) else list(values))
+
+    if not array.size:
+        return []
+
+    if not numpy.issubdtype(array.dtype, numpy.integer):
+        array = numpy.rint(array)  # Half to even, the same as `round`
+
+    array = array.astype(int)
+    codes = (array[:, 0] << 16) | (array[:, 1] << 8) | array[:, 2]
+
+    return [f"#{code:06X}" for code in codes.tolist()]
+
+
+def hex_to_rgb_many(
+    values: collections.abc.Iterable[str],
+    /,
+) -> list[tuple[int, int, int]]:
+    """Convert lots of hexadecimal codes to RGB codes at once.
+
+    * `values`: hexadecimal codes
+
+    It is vectorized when `numpy` is installed and all the codes have six
+    digits.
+    """
+    values = list(values)
+    text = "".join(values)
+
+    if numpy is None or len(text) != len(values)*7 or text[::7] != "#"*len(values):
+        return [hex_to_rgb(value) for value in values]
+
+    array = numpy.frombuffer(bytes.fromhex(text.replace("#", "")), numpy.uint8)
+
+    return list(map(tuple, array.reshape(-1, 3).tolist()))
+
+
+_CACHED_FUNCTIONS = (hex_to_rgb, hex_to_rgba, name_to_rgb, fix_hex_length, str_to_rgb)
+
+
+def cache_info() -> dict[str, typing.Any]:
+    """Return the statistics of the caches of the converters, keyed by the
+    names of the converters.
+
+    Each value is a named tuple with the fields `hits`, `misses`, `maxsize`
+    and `currsize`, the same as the one returned by `functools.lru_cache`.
+    """
+    return {func.__name__: func.cache_info() for func in _CACHED_FUNCTIONS}
+
+
+def cache_clear() -> None:
+    """Clear the caches of the converters."""
+    for func in _CACHED_FUNCTIONS:
+        func.cache_clear()
+
+
 # Alias
 
 rgb2hex = rgb_to_hex
@@ -7,6 +7,8 @@ __all__ = [
     "transition",
     "blend",
     "gradient",
+    "blend_array",
+    "gradient_array",
 ]
 
 import collections.abc
@@ -14,6 +16,11 @@ import statistics
 
 from ..animation import controllers
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 
 def contrast(
     value: tuple[int, int, int],
@@ -91,3 +98,52 @@ def gradient(
         rgb_list.append(tuple(c + round(x*r) for c, r in zip(first, delta)))
 
     return rgb_list
+
+
+def blend_array(
+    values: collections.abc.Sequence[tuple[int, int, int]] | numpy.ndarray,
+    weights: collections.abc.Sequence[float] | numpy.ndarray | None = None,
+) -> tuple[int, int, int]:
+    """Mix lots of colors by weight at once.
+
+    * `values`: RGB codes, a sequence or an array of shape (N, 3)
+    * `weights`: weights, default value indicates the same weights
+
+    It is vectorized when `numpy` is installed.
+    """
+    if numpy is None:
+        return blend(*values, weights=None if weights is None else list(weights))
+
+    color = numpy.average(numpy.asarray(values, dtype=float), axis=0, weights=weights)
+
+    return tuple(int(v) for v in numpy.round(color))
+
+
+def gradient_array(
+    first: tuple[int, int, int],
+    second: tuple[int, int, int],
+    count: int,
+    rate: float = 1,
+    *,
+    channels: tuple[bool, bool, bool] = (True, True, True),
+    controller: collections.abc.Callable[[float], float] = controllers.linear,
+) -> list[tuple[int, int, int]]:
+    """Get color gradients from one color to another proportionally at once.
+
+    * `first`: the first RGB code
+    * `second`: the second RGB code
+    * `count`: the number of gradients
+    * `rate`: transition rate
+    * `channels`: three color channels
+    * `controller`: control function
+
+    It returns the same list as `gradient`, which is vectorized when `numpy`
+    is installed.
+    """
+    if numpy is None:
+        return gradient(first, second, count, rate, channels=channels, contoller=controller)
+
+    delta = rate * (numpy.asarray(second) - first) * channels
+    x = numpy.fromiter((controller(i/count) for i in range(count)), float, count)
+
+    return list(map(tuple, (first + numpy.round(numpy.outer(x, delta)).astype(int)).tolist()))
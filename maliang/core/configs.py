@@ -45,6 +45,9 @@ class Env:
     gradient_animation: bool
     auto_update: bool
 
+    # Whether all animations are driven by a single shared clock
+    shared_clock: bool
+
     # Dynamic value
     root = _DefaultRootDescriptor()
 
@@ -55,6 +58,7 @@ class Env:
         cls.theme = "light"
         cls.gradient_animation = True
         cls.auto_update = True
+        cls.shared_clock = False
 
     @staticmethod
     def get_default_system() -> str:
@@ -16,9 +16,11 @@ __all__ = [
 ]
 
 import abc
+import collections
 import collections.abc
 import functools
 import sys
+import time
 import tkinter
 import tkinter.font
 import traceback
@@ -26,6 +28,7 @@ import typing
 
 import typing_extensions
 
+from ..color import convert
 from ..theme import manager
 from ..toolbox import enhanced, utility
 from . import configs, virtual
@@ -173,30 +176,54 @@ class Tk(tkinter.Tk, Misc):
         *,
         include_children: bool = True,
         include_canvases: bool = True,
+        callback: collections.abc.Callable[[], typing.Any] | None = None,
     ) -> None:
         """Change the color theme of the window
 
         * `value`: theme name
         * `include_children`: wether include its children, like Toplevel
         * `include_canvases`: wether include its canvases
+        * `callback`: a function that is called when all the included windows
+        and canvases have finished changing the theme
         """
-        self.update()
+        children: list[Toplevel] = []
+        canvases: list[Canvas] = []
+
+        if include_children:
+            children = [child for child in self.children.values() if isinstance(child, Toplevel)]
+
+        if include_canvases:
+            canvases = [canvas for canvas in self.canvases if canvas.auto_update]
+
+        if not any(canvas.theme_time_slice > 0 for canvas in canvases):
+            self.update()  # Time-sliced canvases show the visible widgets first
+
         self.configure(bg=getattr(self, value)["bg"])
 
         if sys.platform == "win32":  # Now only support for Windows OS
             manager.apply_theme(
                 self, theme="dark" if value == "dark" else "normal")
 
-        if include_children:
-            for child in self.children.values():
-                if isinstance(child, Toplevel):
-                    child.theme(value, include_canvases=include_canvases,
-                                include_children=include_children)
+        remaining = len(children) + len(canvases) + 1
 
-        if include_canvases:
-            for canvas in self.canvases:
-                if canvas.auto_update:
-                    canvas.theme(value)
+        def finish() -> None:
+            nonlocal remaining
+            remaining -= 1
+
+            if remaining == 0 and callback is not None:
+                try:
+                    callback()
+                except Exception as exc:  # pylint: disable=W0718
+                    traceback.print_exception(exc)
+
+        for child in children:
+            child.theme(value, include_canvases=include_canvases,
+                        include_children=include_children, callback=finish)
+
+        for canvas in canvases:
+            canvas.theme(value, callback=finish)
+
+        finish()
 
     def geometry(
         self,
@@ -428,6 +455,21 @@ class Canvas(tkinter.Canvas, Misc):
         "selectborderwidth": 0,
     }
 
+    # Methods that need the deferred modifications to be applied in advance
+    # (`addtag_withtag` is left out, tagging new items does not need it)
+    _FLUSHED_METHODS = (
+        "itemcget", "bbox", "scale", "moveto", "lift", "lower", "tag_raise",
+        "tag_lower", "gettags", "dtag", "find_all",
+        "find_withtag", "find_overlapping", "find_enclosed", "find_closest",
+        "type", "index", "insert", "dchars", "icursor", "postscript",
+    )
+
+    # Methods that change the visible area of the canvas
+    _CULLED_METHODS = (
+        "xview", "yview", "xview_moveto", "yview_moveto", "xview_scroll",
+        "yview_scroll", "scan_dragto",
+    )
+
     def __init__(
         self,
         master: Tk | Toplevel | Canvas | None = None,
@@ -438,6 +480,11 @@ class Canvas(tkinter.Canvas, Misc):
         free_anchor: bool = False,
         auto_update: bool | None = None,
         zoom_all_items: bool = False,
+        spatial_index: bool = False,
+        deferred_rendering: bool = False,
+        resample_delay: int = 0,
+        viewport_culling: bool = False,
+        theme_time_slice: int = 0,
         **kwargs,
     ) -> None:
         """
@@ -449,6 +496,20 @@ class Canvas(tkinter.Canvas, Misc):
         * `free_anchor`: whether the anchor point is free-floating
         * `auto_update`: whether the theme manager update it automatically
         * `zoom_all_items`: (Experimental) whether or not to scale its all items
+        * `spatial_index`: whether to dispatch pointer events only to the widgets
+        near the pointer, which is faster when there are lots of widgets
+        * `deferred_rendering`: whether to collect the modifications of items
+        and apply them together when idle, which reduces the calls to Tcl
+        * `resample_delay`: if it is greater than 0, images are only moved while
+        the canvas is being resized, and are resampled once the size has not
+        changed for this many milliseconds
+        * `viewport_culling`: whether to hide the widgets outside the visible
+        area and skip them in event dispatch and theme updates, which also
+        enables `spatial_index`
+        * `theme_time_slice`: if it is greater than 0, only the visible widgets
+        are updated immediately when the theme is changed, and the others are
+        updated without animation when idle, in chunks of about this many
+        milliseconds, so that the window keeps responding
         * `kwargs`: compatible with other parameters of class `tkinter.Canvas`
         """
         tkinter.Canvas.__init__(self, master, **kwargs)
@@ -471,6 +532,42 @@ class Canvas(tkinter.Canvas, Misc):
 
         self.events: list[str] = []
 
+        self.spatial_index: utility.SpatialIndex | None = None
+        self._orders: dict[virtual.Widget, int] = {}
+        self._bg_rgb: tuple[int, int, int] | None = None
+
+        self._pending_coords: dict[int, tuple[float, ...]] = {}
+        self._pending_moves: dict[int, tuple[float, float]] = {}
+        self._pending_options: dict[int, dict[str, typing.Any]] = {}
+        self._flush_id: str | None = None
+
+        self.resample_delay = resample_delay
+        self._resample_id: str | None = None
+
+        self.viewport_culling = viewport_culling
+        self._shown: set[virtual.Widget] = set()
+        self._dirty: set[virtual.Widget] = set()
+        self._outdated: set[virtual.Widget] = set()
+        self._cull_id: str | None = None
+
+        self.theme_time_slice = theme_time_slice
+        self._theme_id: str | None = None
+
+        if deferred_rendering:
+            self.coords = self._deferred_coords
+            self.move = self._deferred_move
+            self.itemconfigure = self.itemconfig = self._deferred_itemconfigure
+
+            for name in self._FLUSHED_METHODS:
+                self._wrap_flushed(name)
+
+        if spatial_index or viewport_culling:
+            self.spatial_index = utility.SpatialIndex()
+
+        if viewport_culling:
+            for name in self._CULLED_METHODS:
+                self._wrap_culled(name)
+
         if auto_update is None:
             self.auto_update = configs.Env.auto_update
         else:
@@ -518,23 +615,140 @@ class Canvas(tkinter.Canvas, Misc):
         """Return the aspect zoom ratio of the widget."""
         return self._size[0]/self.init_size[0], self._size[1]/self.init_size[1]
 
-    def theme(self, value: typing.Literal["light", "dark"]) -> None:
+    def theme(
+        self,
+        value: typing.Literal["light", "dark"],
+        *,
+        callback: collections.abc.Callable[[], typing.Any] | None = None,
+    ) -> None:
         """Change the color theme of the Canvas and its items
 
         * `value`: theme name
+        * `callback`: a function that is called when the widgets of the canvas
+        and its child canvases have all been updated
+
+        If `theme_time_slice` is greater than 0, the widgets outside the visible
+        area are updated later, and the callback of a previous change that has
+        not finished yet is not called any more.
         """
-        self.update()
+        if self._theme_id is not None:
+            self.after_cancel(self._theme_id)
+            self._theme_id = None
+
+        if self.theme_time_slice <= 0:
+            self.update()
+
         self.configure(getattr(self, manager.get_color_mode(), {}))
 
-        for widget in self.widgets:
-            if widget.style.auto_update:
-                if widget.state_before_disabled:
-                    widget.disable()
-                else:
-                    widget.update()
+        remaining = len(self.canvases) + 1
+
+        def finish() -> None:
+            nonlocal remaining
+            remaining -= 1
+
+            if remaining == 0 and callback is not None:
+                try:
+                    callback()
+                except Exception as exc:  # pylint: disable=W0718
+                    traceback.print_exception(exc)
+
+        rest: collections.deque[virtual.Widget] = collections.deque()
+
+        if self.theme_time_slice > 0:
+            x1, y1, x2, y2 = self.viewport()
+
+            for widget in self.widgets:
+                if widget.style.auto_update:
+                    left, top, right, bottom = widget.region()
+                    if left <= x2 and right >= x1 and top <= y2 and bottom >= y1:
+                        self._apply_theme(widget)
+                    else:
+                        rest.append(widget)
+        else:
+            for widget in self.widgets:
+                if widget.style.auto_update:
+                    if widget.culled:
+                        self._outdated.add(widget)  # Updated when it is visible
+                    elif widget.state_before_disabled:
+                        widget.disable()
+                    else:
+                        widget.update()
 
         for canvas in self.canvases:
-            canvas.theme(value)
+            canvas.theme(value, callback=finish)
+
+        if rest:
+            self._theme_id = self.after_idle(self._apply_theme_chunk, rest, finish)
+        else:
+            finish()
+
+    def _apply_theme(
+        self,
+        widget: virtual.Widget,
+        gradient_animation: bool | None = None,
+    ) -> None:
+        """Update a widget, but not its child widgets, for the changed theme.
+
+        * `widget`: the widget
+        * `gradient_animation`: whether use gradient animation
+        """
+        if widget.culled:
+            self._outdated.add(widget)  # Updated when it is visible
+        elif widget.state_before_disabled:
+            widget.update("disabled", gradient_animation=gradient_animation, nested=False)
+        else:
+            widget.update(gradient_animation=gradient_animation, nested=False)
+
+    def _apply_theme_chunk(
+        self,
+        widgets: collections.deque[virtual.Widget],
+        callback: collections.abc.Callable[[], typing.Any],
+    ) -> None:
+        """Update the widgets outside the visible area for the changed theme
+        until the time slice runs out, and schedule the rest.
+
+        * `widgets`: the widgets that have not been updated
+        * `callback`: the function called when all the widgets are updated
+        """
+        self._theme_id = None
+        deadline = time.perf_counter() + self.theme_time_slice/1000
+
+        while widgets:
+            widget = widgets.popleft()
+
+            if hasattr(widget, "style"):  # It may have been destroyed
+                self._apply_theme(widget, False)
+
+            if time.perf_counter() >= deadline:
+                break
+
+        if widgets:
+            self._theme_id = self.after_idle(self._apply_theme_chunk, widgets, callback)
+        else:
+            callback()
+
+    @typing_extensions.override
+    def configure(
+        self,
+        cnf: dict[str, typing.Any] | str | None = None,
+        **kwargs,
+    ) -> typing.Any:
+        """Configure resources of the widget."""
+        if kwargs.keys() & {"bg", "background"} or (
+                isinstance(cnf, dict) and cnf.keys() & {"bg", "background"}):
+            self._bg_rgb = None  # Clear cache to update background
+
+        return tkinter.Canvas.configure(self, cnf, **kwargs)
+
+    config = configure
+
+    def get_bg_rgb(self) -> tuple[int, int, int]:
+        """Return the RGB code of the background color, which is cached until
+        the background color is changed."""
+        if self._bg_rgb is None:
+            self._bg_rgb = convert.str_to_rgb(self.cget("bg"))
+
+        return self._bg_rgb
 
     def _initialization(self) -> None:
         """Initialization of size data."""
@@ -581,6 +795,8 @@ class Canvas(tkinter.Canvas, Misc):
 
     def _zoom_self(self) -> None:
         """Scale the `Canvas` itself."""
+        self.schedule_cull()
+
         if not hasattr(self, "_size"):
             self._initialization()
             return
@@ -610,6 +826,113 @@ class Canvas(tkinter.Canvas, Misc):
         for canvas in self.canvases:
             canvas.zoom()
 
+    def schedule_resample(self) -> None:
+        """Resample the images of the widgets after `resample_delay`
+        milliseconds, and the previous schedule is cancelled."""
+        if self._resample_id is not None:
+            self.after_cancel(self._resample_id)
+
+        self._resample_id = self.after(self.resample_delay, self._resample)
+
+    def _resample(self) -> None:
+        """Resample the images of all the widgets."""
+        self._resample_id = None
+
+        for widget in self.widgets:
+            for image in widget.images:
+                image.resample()
+
+    def viewport(self) -> tuple[float, float, float, float]:
+        """Return the visible area of the canvas in canvas coordinates, which
+        changes with its size and the scrolling of `xview` and `yview`."""
+        x, y = self.canvasx(0), self.canvasy(0)
+        return x, y, x + self.winfo_width(), y + self.winfo_height()
+
+    def schedule_cull(self, widget: virtual.Widget | None = None) -> None:
+        """Schedule the viewport culling to be performed when idle.
+
+        It only works when `viewport_culling` is enabled.
+
+        * `widget`: the widget whose region has been changed
+        """
+        if not self.viewport_culling:
+            return
+
+        if widget is not None:
+            self._dirty.add(widget)
+
+        if self._cull_id is None:
+            self._cull_id = self.after_idle(self.cull)
+
+    def cull(self) -> None:
+        """Hide the widgets entirely outside the visible area and show those
+        entering it again immediately.
+
+        Only the widgets around the visible area, the ones shown last time and
+        the ones whose regions have been changed are checked.
+        """
+        if self._cull_id is not None:
+            self.after_cancel(self._cull_id)
+            self._cull_id = None
+
+        if not self.viewport_culling:
+            return
+
+        x1, y1, x2, y2 = viewport = self.viewport()
+        shown: set[virtual.Widget] = set()
+
+        for widget in self._shown | self._dirty | self.spatial_index.query_region(viewport):
+            if widget not in self.spatial_index:
+                continue  # It is destroyed or forgotten
+
+            left, top, right, bottom = widget.region()
+
+            if left <= x2 and right >= x1 and top <= y2 and bottom >= y1:
+                shown.add(widget)
+                if widget.culled:
+                    self._set_culled(widget, False)
+            elif not widget.culled:
+                self._set_culled(widget, True)
+
+        self._shown = shown
+        self._dirty.clear()
+
+    def _set_culled(self, widget: virtual.Widget, value: bool) -> None:
+        """Hide or show the items of a widget for viewport culling.
+
+        * `widget`: the widget
+        * `value`: whether the widget is culled
+        """
+        widget.culled = value
+        state = "hidden" if value else "normal"
+
+        for element in widget.elements:
+            for item in element.items:
+                self.itemconfigure(item, state=state)
+
+        if not value and widget in self._outdated:
+            self._outdated.discard(widget)
+            if widget.state_before_disabled:
+                widget.disable()
+            else:
+                widget.update()
+
+    def _wrap_culled(self, method_name: str) -> None:
+        """Decorate the original method so that the viewport culling is
+        scheduled after it is called.
+
+        * `method_name`: the name of the method to be decorated
+        """
+        method = getattr(self, method_name)
+
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs) -> typing.Any:
+            result = method(*args, **kwargs)
+            self.schedule_cull()
+            return result
+
+        setattr(self, method_name, wrapper)
+
     def _zoom_tk_widgets(self, rel_ratio: tuple[float, float]) -> None:
         """Scale the tkinter widgets of the Canvas.
 
@@ -630,11 +953,25 @@ class Canvas(tkinter.Canvas, Misc):
         """Destroy this and all descendants widgets."""
         self.master.canvases.remove(self)
 
+        if self._flush_id is not None:
+            self.after_cancel(self._flush_id)
+
+        if self._resample_id is not None:
+            self.after_cancel(self._resample_id)
+
+        if self._cull_id is not None:
+            self.after_cancel(self._cull_id)
+
+        if self._theme_id is not None:
+            self.after_cancel(self._theme_id)
+
         for widget in tuple(self.widgets):
             # Nested widget will be destroyed by its parent widget
             if not widget.nested:
                 widget.destroy()
 
+        enhanced.font_registry.clear(self)
+
         return tkinter.Canvas.destroy(self)
 
     def clear(self) -> None:
@@ -642,84 +979,253 @@ class Canvas(tkinter.Canvas, Misc):
         self.canvases.clear()
         self.widgets.clear()
 
+        if self.spatial_index is not None:
+            self.spatial_index.clear()
+
+        self._shown.clear()
+        self._dirty.clear()
+        self._outdated.clear()
+
+        if self._theme_id is not None:
+            self.after_cancel(self._theme_id)
+            self._theme_id = None
+
         for child in tuple(self.children.values()):
             child.destroy()
 
         self.delete(*self.find_all())
+        enhanced.font_registry.clear(self)
 
     @typing_extensions.override
     def create_text(self, x: float, y: float, /, *args, **kwargs) -> int:
         """Create text with coordinates x, y."""
+        # The fonts are interned and kept until the Canvas is destroyed, as the
+        # deletion of the items is not tracked
         font = kwargs.get("font")
         if not font:
-            kwargs["font"] = tkinter.font.Font(
-                family=configs.Font.family, size=configs.Font.size)
+            kwargs["font"] = enhanced.font_registry.acquire(
+                self, configs.Font.family, configs.Font.size)
         elif isinstance(font, str):
-            kwargs["font"] = tkinter.font.Font(
-                family=font, size=configs.Font.size)
+            kwargs["font"] = enhanced.font_registry.acquire(
+                self, font, configs.Font.size)
         elif isinstance(font, int):
-            kwargs["font"] = tkinter.font.Font(
-                family=configs.Font.family, size=-abs(font))
+            kwargs["font"] = enhanced.font_registry.acquire(
+                self, configs.Font.family, -abs(font))
         elif isinstance(font, tkinter.font.Font):
             kwargs["font"].config(size=-abs(font.cget("size")))
         else:
-            kwargs["font"] = tkinter.font.Font(
-                family=font[0], size=-abs(font[1]),
-                weight=font[2] if len(font) > 2 else "normal",
-                slant=font[3] if len(font) > 3 else "roman")
+            kwargs["font"] = enhanced.font_registry.acquire(
+                self, font[0], -abs(font[1]),
+                font[2] if len(font) > 2 else "normal",
+                font[3] if len(font) > 3 else "roman")
 
         return tkinter.Canvas.create_text(self, x, y, *args, **kwargs)
 
+    def flush(self) -> None:
+        """Apply the deferred modifications of items immediately.
+
+        It only works when `deferred_rendering` is enabled, and is called
+        automatically when idle.
+        """
+        if self._flush_id is not None:
+            self.after_cancel(self._flush_id)
+            self._flush_id = None
+
+        commands: list[tuple[typing.Any, ...]] = []
+
+        for item, points in self._pending_coords.items():
+            commands.append((self._w, "coords", item, *points))
+
+        for item, (dx, dy) in self._pending_moves.items():
+            commands.append((self._w, "move", item, dx, dy))
+
+        for item, options in self._pending_options.items():
+            # Converted like `itemconfigure` does, None values are skipped
+            commands.append((self._w, "itemconfigure", item, *self._options(options)))
+
+        self._pending_coords.clear()
+        self._pending_moves.clear()
+        self._pending_options.clear()
+
+        if commands:
+            self.tk.eval("\n".join(map(tkinter._join, commands)))
+
+    def _on_idle(self) -> None:
+        """Called when idle to apply the deferred modifications of items."""
+        self._flush_id = None
+        self.flush()
+
+    def _schedule_flush(self) -> None:
+        """Schedule the deferred modifications of items to be applied."""
+        if self._flush_id is None:
+            self._flush_id = self.after_idle(self._on_idle)
+
+    def _wrap_flushed(self, method_name: str) -> None:
+        """Decorate the original method so that the deferred modifications of
+        items are applied before it is called.
+
+        * `method_name`: the name of the method to be decorated
+        """
+        method = getattr(self, method_name)
+
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs) -> typing.Any:
+            self.flush()
+            return method(*args, **kwargs)
+
+        setattr(self, method_name, wrapper)
+
+    def _deferred_coords(self, *args) -> list[float] | None:
+        """Deferred version of `coords`, only the modifications of a single
+        item are deferred."""
+        if len(args) < 2 or not isinstance(args[0], int):
+            self.flush()
+            return tkinter.Canvas.coords(self, *args)
+
+        self._pending_moves.pop(args[0], None)  # superseded by new coords
+        self._pending_coords[args[0]] = tkinter._flatten(args[1:])
+        self._schedule_flush()
+
+        return None
+
+    def _deferred_move(self, *args) -> None:
+        """Deferred version of `move`, only the modifications of a single item
+        are deferred."""
+        if len(args) != 3 or not isinstance(args[0], int):
+            self.flush()
+            return tkinter.Canvas.move(self, *args)
+
+        item, dx, dy = args
+
+        if points := self._pending_coords.get(item):
+            self._pending_coords[item] = tuple(
+                value + (dy if i % 2 else dx) for i, value in enumerate(points))
+        else:
+            x, y = self._pending_moves.get(item, (0, 0))
+            self._pending_moves[item] = x + dx, y + dy
+
+        self._schedule_flush()
+
+        return None
+
+    def _deferred_itemconfigure(
+        self,
+        tag_or_id: str | int,
+        cnf: dict[str, typing.Any] | str | None = None,
+        **kwargs,
+    ) -> typing.Any:
+        """Deferred version of `itemconfigure`, only the modifications of a
+        single item are deferred."""
+        if not isinstance(tag_or_id, int) or isinstance(cnf, str) or not (cnf or kwargs):
+            self.flush()
+            return tkinter.Canvas.itemconfigure(self, tag_or_id, cnf, **kwargs)
+
+        options = self._pending_options.setdefault(tag_or_id, {})
+
+        if cnf:
+            options.update(cnf)
+
+        options.update(kwargs)
+        self._schedule_flush()
+
+        return None
+
+    def _get_targets(self, event: tkinter.Event) -> list[virtual.Widget]:
+        """Return the widgets that respond to a pointer event, from top to
+        bottom.
+
+        * `event`: the pointer event
+        """
+        if self.spatial_index is None:
+            return self.widgets[::-1]
+
+        targets = self.spatial_index.query(event.x, event.y)
+        orders = self._orders
+
+        for widget in targets:
+            order = orders.get(widget)
+            if order is None or order >= len(self.widgets) or self.widgets[order] is not widget:
+                # The order of the widgets has been changed, so rebuild it
+                self._orders = orders = {w: i for i, w in enumerate(self.widgets)}
+                break
+
+        return sorted(
+            (widget for widget in targets if widget in orders),
+            key=orders.__getitem__, reverse=True)
+
+    def _settle_targets(self, targets: list[virtual.Widget]) -> None:
+        """Keep the widgets that are not in normal state responding to the
+        following pointer events, so that they can know the pointer has left.
+
+        * `targets`: the widgets that responded to the last pointer event
+        """
+        if self.spatial_index is None:
+            return
+
+        active: set[virtual.Widget] = set()
+
+        for widget in targets:
+            if not widget.state.startswith(("normal", "disabled")):
+                while widget is not None and widget not in active:
+                    active.add(widget)
+                    widget = widget.widget
+
+        self.spatial_index.active = active
+
     def on_motion(self, event: tkinter.Event, name: str) -> None:
         """Events to move the mouse"""
         self.trigger_config.reset()
-        for widget in self.widgets[::-1]:
-            if hasattr(widget, "feature") and not widget.disappeared:
+        for widget in (targets := self._get_targets(event)):
+            if hasattr(widget, "feature") and not widget.disappeared and not widget.culled:
                 flag = widget.feature.get_method(name)(event)
                 if widget.capture_events is None:
                     if flag:
                         event.x = 9999
                 elif widget.capture_events:
                     event.x = 9999
+        self._settle_targets(targets)
         self.trigger_config.update(cursor="arrow")
 
     def on_click(self, event: tkinter.Event, name: str) -> None:
         """Events to active the mouse"""
         self.focus_set()
         self.trigger_focus.reset()
-        for widget in self.widgets[::-1]:
-            if hasattr(widget, "feature") and not widget.disappeared:
+        for widget in (targets := self._get_targets(event)):
+            if hasattr(widget, "feature") and not widget.disappeared and not widget.culled:
                 if widget.feature.get_method(name)(event) and widget.capture_events:
                     event.x = 9999
+        self._settle_targets(targets)
         self.trigger_focus.update(True, "")
 
     def on_release(self, event: tkinter.Event, name: str) -> None:
         """Events to release the mouse"""
-        for widget in self.widgets[::-1]:
-            if hasattr(widget, "feature") and not widget.disappeared:
+        for widget in (targets := self._get_targets(event)):
+            if hasattr(widget, "feature") and not widget.disappeared and not widget.culled:
                 if widget.feature.get_method(name)(event) and widget.capture_events:
                     event.x = 9999
+        self._settle_targets(targets)
 
     def on_wheel(self, event: tkinter.Event, type_: bool | None) -> None:
         """Events to scroll the mouse wheel"""
         if type_ is not None:
             event.delta = 120 if type_ else -120
-        for widget in self.widgets[::-1]:
-            if hasattr(widget, "feature") and not widget.disappeared:
+        for widget in (targets := self._get_targets(event)):
+            if hasattr(widget, "feature") and not widget.disappeared and not widget.culled:
                 if widget.feature.get_method("<MouseWheel>")(event) and widget.capture_events:
                     event.x = 9999
+        self._settle_targets(targets)
 
     def on_key_press(self, event: tkinter.Event) -> None:
         """Events for typing"""
         for widget in self.widgets[::-1]:
-            if hasattr(widget, "feature") and not widget.disappeared:
+            if hasattr(widget, "feature") and not widget.disappeared and not widget.culled:
                 if widget.feature.get_method("<KeyPress>")(event) and widget.capture_events:
                     event.x = 9999
 
     def on_key_release(self, event: tkinter.Event) -> None:
         """Events for typing"""
         for widget in self.widgets[::-1]:
-            if hasattr(widget, "feature") and not widget.disappeared:
+            if hasattr(widget, "feature") and not widget.disappeared and not widget.culled:
                 if widget.feature.get_method("<KeyRelease>")(event) and widget.capture_events:
                     event.x = 9999
 
@@ -27,6 +27,7 @@ __all__ = [
 import abc
 import collections.abc
 import copy
+import itertools
 import math
 import re
 import tkinter
@@ -91,18 +92,24 @@ class Element(abc.ABC):
 
         self.kwargs = kwargs
 
+        self._bindings: dict[int, tuple[tuple[str, str], ...]] = {}
+        self._applied: dict[int, dict[str, str]] = {}
+
         widget.register_elements(self)
 
-    def move(self, dx: float, dy: float) -> None:
+    def move(self, dx: float, dy: float, *, moved: bool = False) -> None:
         """Move the `Element`.
 
         * `dx`: x-coordinate offset
         * `dy`: y-coordinate offset
+        * `moved`: whether the items have been moved together with the widget,
+        the items that are not tagged by `Widget.tag_items` are always moved
         """
         self.position = self.position[0]+dx, self.position[1]+dy
 
         for item in self.items:
-            self.widget.master.move(item, dx, dy)
+            if not moved or item not in self.widget.tagged_items:
+                self.widget.master.move(item, dx, dy)
 
     def moveto(self, x: float, y: float) -> None:
         """Move the `Element` to a certain position.
@@ -119,6 +126,10 @@ class Element(abc.ABC):
 
         self.widget.deregister_elements(self)
         self.widget.master.delete(*self.items)
+        self.widget.tagged_items.difference_update(self.items)
+
+        self._bindings.clear()
+        self._applied.clear()
 
     def center(self) -> tuple[float, float]:
         """Return the geometric center of the `Element`."""
@@ -155,7 +166,7 @@ class Element(abc.ABC):
         if state is None:
             state = self.widget.state
 
-        if data := self.widget.style[self].get(state):
+        if data := self.widget.style.lookup(self, state):
             self.configure(data, gradient_animation=gradient_animation)
 
     def configure(
@@ -174,41 +185,75 @@ class Element(abc.ABC):
 
         self.gradients.clear()
 
-        bg = convert.str_to_rgb(self.widget.master.cget("bg"))
+        bg = self.widget.master.get_bg_rgb()
+        gradient_animation = (self.widget.gradient_animation
+                              and self.gradient_animation and gradient_animation)
 
         for item in self.items:
-            tags = self.widget.master.itemcget(item, "tags").split()
-            keys, args = tags[0:-1:2], tags[1:len(tags):2]
-            values = (style.get(arg) for arg in args)
-            kwargs = {k: v for k, v in zip(keys, values) if v is not None}
+            applied = self._applied.setdefault(item, {})
+            kwargs = {}
+
+            for key, arg in self._get_bindings(item):
+                if (value := style.get(arg)) is None:
+                    continue
 
-            for key, value in kwargs.items():
                 if value.startswith("#") and len(value) == 9:
                     rgba_code = convert.hex_to_rgba(value)
-                    kwargs[key] = convert.rgb_to_hex(
+                    value = convert.rgb_to_hex(
                         convert.rgba_to_rgb(rgba_code, refer=bg))
 
-            if self.widget.gradient_animation and self.gradient_animation and gradient_animation:
+                if applied.get(key) != value:
+                    kwargs[key] = value
+
+            if not kwargs:
+                continue
+
+            if gradient_animation:
                 for key, value in kwargs.items():
-                    start: str = self.widget.master.itemcget(item, key)
+                    start = applied.pop(key, None)
 
-                    if start.startswith("#") and len(start) == 9:
-                        rgba_code = convert.hex_to_rgba(start)
-                        start = convert.rgb_to_hex(
-                            convert.rgba_to_rgb(rgba_code, refer=bg))
+                    if start is None:
+                        start = self.widget.master.itemcget(item, key)
 
-                    if value == "" or start == "":
+                        if start.startswith("#") and len(start) == 9:
+                            rgba_code = convert.hex_to_rgba(start)
+                            start = convert.rgb_to_hex(
+                                convert.rgba_to_rgb(rgba_code, refer=bg))
+
+                    if value == start:
+                        applied[key] = value
+                    elif value == "" or start == "":
                         # Null characters cannot be parsed
                         self.widget.master.itemconfigure(item, {key: value})
+                        applied[key] = value
                     else:
                         self.gradients.append(animations.GradientItem(
-                            self.widget.master, item, key, (start, value), 150))
+                            self.widget.master, item, key, (start, value), 150,
+                            end=lambda d=applied, k=key, v=value: d.__setitem__(k, v)))
             else:
                 self.widget.master.itemconfigure(item, kwargs)
+                applied.update(kwargs)
 
         for gradient in self.gradients:
             gradient.start()
 
+    def _get_bindings(self, item: int) -> tuple[tuple[str, str], ...]:
+        """Return the pairs of the option of the item and the key of the style.
+
+        The pairs are parsed from the tags of the item only once, since the
+        tags are not modified after the item is displayed. The tags of the
+        widgets added by `Widget.tag_items` are ignored.
+
+        * `item`: the item of the `Element`
+        """
+        if (bindings := self._bindings.get(item)) is None:
+            tags = [tag for tag in self.widget.master.itemcget(item, "tags").split()
+                    if not tag.startswith(Widget.TAG_PREFIX) and tag != "current"]
+            bindings = tuple(zip(tags[0:-1:2], tags[1:len(tags):2]))
+            self._bindings[item] = bindings
+
+        return bindings
+
     def forget(
         self,
         value: bool = True,
@@ -224,7 +269,7 @@ class Element(abc.ABC):
 
         if value:
             temp_style = copy.deepcopy(
-                self.widget.style[self].get(self.widget.state))
+                self.widget.style.lookup(self, self.widget.state))
 
             if temp_style is None:
                 return
@@ -242,12 +287,15 @@ class Element(abc.ABC):
         *,
         zoom_position: bool = True,
         zoom_size: bool = True,
+        scaled: bool = False,
     ) -> None:
         """Zoom the `Element`.
 
         * `ratios`: ratios of zooming
         * `zoom_position`: whether or not to zoom the location of the element
         * `zoom_size`: whether or not to zoom the size of the element
+        * `scaled`: whether the items have been scaled together with the widget,
+        the items that are not tagged by `Widget.tag_items` are always scaled
         """
         if not zoom_position and not zoom_size:
             warnings.warn("This is a no-effect call.", UserWarning, 2)
@@ -268,7 +316,8 @@ class Element(abc.ABC):
                 self.widget.master.scale(item, *self.position, *ratios)
         else:
             for item in self.items:
-                self.widget.master.scale(item, 0, 0, *ratios)
+                if not scaled or item not in self.widget.tagged_items:
+                    self.widget.master.scale(item, 0, 0, *ratios)
 
     @abc.abstractmethod
     def display(self) -> None:
@@ -304,12 +353,15 @@ class Shape(Element):
         *,
         zoom_position: bool = True,
         zoom_size: bool = True,
+        scaled: bool = False,
     ) -> None:
         """Scale the shape.
 
         * `ratios`: ratios of zooming
         * `zoom_position`: whether or not to zoom the location of the shape
         * `zoom_size`: whether or not to zoom the size of the shape
+        * `scaled`: whether the items have been scaled together with the widget,
+        the coordinates of the shape are always recalculated
         """
         if zoom_size:
             self.size = self.size[0]*ratios[0], self.size[1]*ratios[1]
@@ -366,13 +418,11 @@ class Text(Element):
         self.placeholder = placeholder
         self.limit = limit
 
-        self.font = tkinter.font.Font(
-            family=family if family else configs.Font.family,
-            size=-abs(fontsize if fontsize else configs.Font.size),
-            weight=weight, slant=slant,
-            underline=underline, overstrike=overstrike)
+        self._initial_fontsize = -abs(fontsize if fontsize else configs.Font.size)
 
-        self._initial_fontsize = self.font.cget("size")
+        self.font = enhanced.font_registry.acquire(
+            widget.master, family if family else configs.Font.family,
+            self._initial_fontsize, weight, slant, underline, overstrike)
 
         Element.__init__(self, widget, relative_position, size, name=name,
                          gradient_animation=gradient_animation, **kwargs)
@@ -391,18 +441,55 @@ class Text(Element):
         *,
         zoom_position: bool = True,
         zoom_size: bool = True,
+        scaled: bool = False,
     ) -> None:
         """Scale the text.
 
         * `ratios`: ratios of zooming
         * `zoom_position`: whether or not to zoom the location of the text
         * `zoom_size`: whether or not to zoom the size of the text
+        * `scaled`: whether the items have been scaled together with the widget
         """
-        Element.zoom(
-            self, ratios, zoom_position=zoom_position, zoom_size=zoom_size)
+        Element.zoom(self, ratios, zoom_position=zoom_position,
+                     zoom_size=zoom_size, scaled=scaled)
 
-        self.font.config(size=round(self._initial_fontsize*math.sqrt(
-            self.widget.master.ratios[0]*self.widget.master.ratios[1])))
+        self._scale_font(self.font)
+
+    @typing_extensions.override
+    def destroy(self) -> None:
+        """Destroy the `Text` and release its font."""
+        Element.destroy(self)
+        enhanced.font_registry.release(self.font)
+
+    def _scale_font(self, font: tkinter.font.Font) -> None:
+        """Set the actual size of the font according to the ratios of the canvas.
+
+        * `font`: the font of the text
+        """
+        # The canvas has no ratios until it is configured for the first time
+        ratios = getattr(self.widget.master, "ratios", (1, 1))
+        enhanced.font_registry.scale(font, math.sqrt(ratios[0]*ratios[1]))
+
+    def set_font(self, **options: typing.Any) -> None:
+        """Change the font of the text only.
+
+        * `options`: options of the font, such as `size`, `weight` and
+        `underline`, the size is the size before zooming
+
+        The font may be shared with other texts, so the text is given another
+        font instead of changing the shared one.
+        """
+        if "size" in options:
+            self._initial_fontsize = options["size"] = -abs(options["size"])
+
+        font = enhanced.font_registry.replace(self.font, **options)
+        self._scale_font(font)
+
+        if font is not self.font:
+            self.font = font
+
+            for item in self.items:
+                self.widget.master.itemconfigure(item, font=font)
 
 
 class Image(Element):
@@ -448,20 +535,34 @@ class Image(Element):
         *,
         zoom_position: bool = True,
         zoom_size: bool = True,
+        scaled: bool = False,
     ) -> None:
         """Scale the image.
 
         * `ratios`: ratios of zooming
         * `zoom_position`: whether or not to zoom the location of the image
         * `zoom_size`: whether or not to zoom the size of the image
+        * `scaled`: whether the items have been scaled together with the widget
         """
-        Element.zoom(
-            self, ratios, zoom_position=zoom_position, zoom_size=zoom_size)
+        Element.zoom(self, ratios, zoom_position=zoom_position,
+                     zoom_size=zoom_size, scaled=scaled)
 
         if self.initail_image is None:
             raise RuntimeError("Image is empty.")
 
-        self.image = self.initail_image.scale(*self.widget.master.ratios)
+        if self.widget.master.resample_delay > 0:
+            # Only reposition the image, it is resampled when the size settles
+            self.widget.master.schedule_resample()
+        else:
+            self.resample()
+
+    def resample(self) -> None:
+        """Resample the image according to the ratios of the canvas."""
+        if self.initail_image is None:
+            return
+
+        self.image = enhanced.image_cache.scale(
+            self.initail_image, *self.widget.master.ratios)
 
         for item in self.items:
             self.widget.master.itemconfigure(item, image=self.image)
@@ -475,6 +576,13 @@ class Style:
     light: dict[str, dict[str, dict[str, str]]] = {}
     dark: dict[str, dict[str, dict[str, str]]] = {}
 
+    # The compiled style data shared by the instances of each class, the key is
+    # (class, theme, RGB code of the background)
+    _compiled_tables: dict[
+        tuple[type[Style], str, tuple[int, int, int]],
+        tuple[dict[str, dict[str, dict[str, str]]], dict[str, dict[str, dict[str, str]]]],
+    ] = {}
+
     def __init__(
         self,
         widget: Widget,
@@ -492,10 +600,59 @@ class Style:
         else:
             self.auto_update = auto_update
 
-        self.light = copy.deepcopy(self.light)
-        self.dark = copy.deepcopy(self.dark)
-
+        # The style data of the class are shared until they are modified, see
+        # method `_copy_on_write`
+        self._owned: set[int] = set()
         self._cache: dict[str, dict[str, dict[str, str]]] = {}
+        self._compiled: dict[
+            tuple[str, tuple[int, int, int]],
+            tuple[dict[str, dict[str, dict[str, str]]], dict[str, dict[str, dict[str, str]]]],
+        ] = {}
+
+    def _copy_on_write(
+        self,
+        theme: typing.Literal["light", "dark"],
+        *keys: str,
+    ) -> dict:
+        """Return the style data of a theme, or the data of an element or a
+        state in it, which can be modified by the instance only.
+
+        The data shared with the class are copied shallowly, and only the ones
+        on the path to the target are copied.
+
+        * `theme`: the theme name
+        * `keys`: the name of the element and the name of the state
+        """
+        self._compiled.clear()
+        data = getattr(self, theme)
+
+        if id(data) not in self._owned:
+            data = self._own(data.copy())
+            if self._cache is getattr(self, theme):
+                self._cache = data
+            setattr(self, theme, data)
+
+        for key in keys:
+            if id(child := data[key]) not in self._owned:
+                child = data[key] = self._own(child.copy())
+            data = child
+
+        return data
+
+    def _own(self, data: dict) -> dict:
+        """Mark the data as owned by the instance.
+
+        * `data`: style data created by the instance
+        """
+        self._owned.add(id(data))
+        return data
+
+    def _get_theme(self, data: dict[str, dict[str, dict[str, str]]]) -> typing.Literal["light", "dark"]:
+        """Return the theme name of the style data returned by `get`.
+
+        * `data`: the style data of a theme
+        """
+        return "light" if data is self.light else "dark"
 
     def _get_key(self, key: Element | str | int) -> str:
         """Get the key.
@@ -521,28 +678,81 @@ class Style:
 
         * `element`: element that style to be calculated
         """
-        if style := self[element].get("disabled"):
-            return style
+        return self.lookup(element, "disabled") or {}
+
+    def lookup(self, key: Element | str | int, state: str) -> dict[str, str] | None:
+        """Return the compiled style data of an element in a state, None
+        indicates there is no style for it.
 
-        if self.widget.state_before_disabled:
-            state = self.widget.state_before_disabled
+        If the disabled state has no style data, it is calculated from the
+        state of the widget before it is disabled.
+
+        * `key`: the key of the element
+        * `state`: the state of the element
+        """
+        styles, disabled_styles = self.compile()
+        name = self._get_key(key)
+
+        if state == "disabled" and "disabled" not in styles.get(name, {}):
+            if self.widget.state_before_disabled:
+                state = self.widget.state_before_disabled
+            else:
+                state = self.widget.state
+
+            return disabled_styles.get(name, {}).get(state)
+
+        return styles.get(name, {}).get(state)
+
+    def compile(self) -> tuple[dict[str, dict[str, dict[str, str]]], dict[str, dict[str, dict[str, str]]]]:
+        """Return the style data of the current theme whose colors have been
+        resolved against the background of the canvas, and the disabled style
+        data calculated from each state.
+
+        The result is shared by the instances of the class until the style of
+        an instance is modified, and it is compiled again when the theme or
+        the background is changed.
+        """
+        data = self.get()
+        theme = self._get_theme(data)
+        bg = self.widget.master.get_bg_rgb()
+
+        if data is getattr(self.__class__, theme):
+            cache, key = Style._compiled_tables, (self.__class__, theme, bg)
         else:
-            state = self.widget.state
+            cache, key = self._compiled, (theme, bg)
 
-        now_style = copy.deepcopy(self.get()[element.name][state])
+        if (result := cache.get(key)) is None:
+            result = cache[key] = self._compile(data, bg)
 
-        bg = convert.str_to_rgb(self.widget.master.cget("bg"))
+        return result
 
-        for key, value in now_style.items():
-            if not value:  # Empty string
-                now_style[key] = value
-                continue
-            now_style[key] = convert.rgb_to_hex(rgb.transition(
-                convert.str_to_rgb(value), bg, configs.Constant.GOLDEN_RATIO))
+    @staticmethod
+    def _compile(
+        data: dict[str, dict[str, dict[str, str]]],
+        bg: tuple[int, int, int],
+    ) -> tuple[dict[str, dict[str, dict[str, str]]], dict[str, dict[str, dict[str, str]]]]:
+        """Compile the style data of a theme.
+
+        * `data`: the style data of a theme
+        * `bg`: RGB code of the background
+        """
+        styles: dict[str, dict[str, dict[str, str]]] = {}
+        disabled_styles: dict[str, dict[str, dict[str, str]]] = {}
+
+        for name, states in data.items():
+            styles[name], disabled_styles[name] = {}, {}
 
-        self[element]["disabled"] = now_style  # cache
+            for state, style in states.items():
+                styles[name][state] = {
+                    key: convert.rgb_to_hex(convert.rgba_to_rgb(convert.hex_to_rgba(value), refer=bg))
+                    if value.startswith("#") and len(value) == 9 else value
+                    for key, value in style.items()}
+                disabled_styles[name][state] = {
+                    key: value and convert.rgb_to_hex(rgb.transition(
+                        convert.str_to_rgb(value), bg, configs.Constant.GOLDEN_RATIO))
+                    for key, value in style.items()}
 
-        return now_style
+        return styles, disabled_styles
 
     def init(
         self,
@@ -559,10 +769,10 @@ class Style:
 
         if theme != "light":
             if not self.dark.get(name):
-                self.dark[name] = {}
+                self._copy_on_write("dark")[name] = self._own({})
         if theme != "dark":
             if not self.light.get(name):
-                self.light[name] = {}
+                self._copy_on_write("light")[name] = self._own({})
 
     def get(
         self,
@@ -588,11 +798,17 @@ class Style:
 
         * `theme`: the theme to be reset, None indicates both
         """
+        self._compiled.clear()
+
         if theme != "light":
-            self.dark = copy.deepcopy(self.__class__.dark)
+            if self._cache is self.dark:
+                self._cache = self.__class__.dark
+            self.dark = self.__class__.dark
 
         if theme != "dark":
-            self.light = copy.deepcopy(self.__class__.light)
+            if self._cache is self.light:
+                self._cache = self.__class__.light
+            self.light = self.__class__.light
 
         for element in self.widget.elements:
             element.update()
@@ -637,9 +853,11 @@ class Style:
                     key, pair = self._get_key(key), {arg: color}
 
                     if theme != "dark":
-                        self.get(theme="light")[key][state].update(pair)
+                        data = self.get(theme="light")
+                        self._copy_on_write(self._get_theme(data), key, state).update(pair)
                     if theme != "light":
-                        self.get(theme="dark")[key][state].update(pair)
+                        data = self.get(theme="dark")
+                        self._copy_on_write(self._get_theme(data), key, state).update(pair)
 
     def set(self) -> None:
         """Set the style of the widget."""
@@ -703,6 +921,11 @@ class Widget:
     `Widget` = `Element` + `Style` + `Feature`
     """
 
+    TAG_PREFIX = "widget:"
+    """The prefix of the tags of the widgets, which are added to their items."""
+
+    _tag_ids = itertools.count()
+
     def __init__(
         self,
         master: containers.Canvas | Widget,
@@ -739,6 +962,7 @@ class Widget:
             self.size: tuple[float, float] = (0, 0) if size is None else size
 
         self.anchor = anchor
+        self.tag = f"{self.TAG_PREFIX}{next(Widget._tag_ids)}"
 
         if capture_events is None and self.nested:
             self.capture_events = False  # bool indicates enforce the operation
@@ -759,16 +983,19 @@ class Widget:
         self.texts: list[Text] = []
         self.shapes: list[Shape] = []
         self.images: list[Image] = []
+        self.tagged_items: set[int] = set()  # Items that carry `self.tag`
         self.style = Style(self) if style is None else style(self)
         self.feature = Feature(self)
 
         self.state: str = "normal"
         self.state_before_disabled: str = ""
         self.disappeared: bool = False
+        self.culled: bool = False
 
         self._update_hooks: list[collections.abc.Callable[[str, bool], typing.Any]] = []
 
         self.master.widgets.append(self)
+        self._update_index()
 
     @property
     def elements(self) -> tuple[Element, ...]:
@@ -796,6 +1023,18 @@ class Widget:
 
         return result
 
+    def _update_index(self) -> None:
+        """Update the region of the widget in the spatial index of the canvas."""
+        if (spatial_index := self.master.spatial_index) is None:
+            return
+
+        if self.disappeared:
+            spatial_index.remove(self)
+        else:
+            spatial_index.insert(self, self.region())
+
+        self.master.schedule_cull(self)
+
     def register_elements(self, *elements: Element) -> None:
         """Register elements to the widget.
 
@@ -810,9 +1049,29 @@ class Widget:
                 self.images.append(element)
 
             element.display()
+            self.tag_items(*element.items)
             element.coords()
             element.update(gradient_animation=True)
 
+    def tag_items(self, *items: int) -> None:
+        """Add the tags of the widget and its parent widgets to the items, so
+        that all the items of a widget can be handled by a single command.
+
+        The items of the elements are tagged when they are registered, other
+        items created later have to be tagged by this, otherwise they are
+        moved and scaled one by one.
+
+        * `items`: items of the elements of the widget
+        """
+        self.tagged_items.update(items)
+        widget = self
+
+        while widget is not None:
+            for item in items:
+                self.master.addtag_withtag(widget.tag, item)
+
+            widget = widget.widget
+
     def deregister_elements(self, *elements: Element) -> None:
         """Deregister a element from the widget.
 
@@ -845,6 +1104,9 @@ class Widget:
         if gradient_animation is None:
             gradient_animation = self.gradient_animation
 
+        if self.culled:
+            gradient_animation = False  # It can not be seen
+
         if nested:
             for widget in self.widgets:
                 widget.update(state, gradient_animation=gradient_animation)
@@ -857,6 +1119,10 @@ class Widget:
         else:
             self.state = state  # update self.state
 
+            if self.master.spatial_index is not None and self in self.master.spatial_index:
+                if not state.startswith(("normal", "disabled")):
+                    self.master.spatial_index.active.add(self)
+
         for command in self._update_hooks:
             try:
                 command(state, gradient_animation)
@@ -925,6 +1191,9 @@ class Widget:
         else:
             self.feature.extra_commands[sequence].append(func)
 
+        if self.master.spatial_index is not None:
+            self.master.spatial_index.pin(self)
+
     def unbind(
         self,
         sequence: str,
@@ -968,11 +1237,7 @@ class Widget:
             if not self.state_before_disabled:
                 self.state_before_disabled = self.state
 
-            for element in self.elements:
-                if isinstance(element, Image):  # No style for Image
-                    continue
-                self.style.get_disabled_style(element=element)
-
+            # The style of disabled state is looked up by `Style.lookup`
             self.update("disabled", gradient_animation=True, nested=False)
         else:
             self.state_before_disabled, last_state = "", self.state_before_disabled
@@ -986,6 +1251,7 @@ class Widget:
         * `value`: whether to forget the widget
         """
         self.disappeared = value
+        self._update_index()
 
         for widget in self.widgets:
             widget.forget(value)
@@ -993,19 +1259,25 @@ class Widget:
         for element in self.elements:
             element.forget(value)
 
-    def move(self, dx: float, dy: float) -> None:
+    def move(self, dx: float, dy: float, *, moved: bool = False) -> None:
         """Move the widget.
 
         * `dx`: x-coordinate offset
         * `dy`: y-coordinate offset
+        * `moved`: whether the items have been moved together with the parent
+        widget
         """
+        if not moved:
+            self.master.move(self.tag, dx, dy)
+
         self.position = self.position[0]+dx, self.position[1]+dy
+        self._update_index()
 
         for widget in self.widgets:
-            widget.move(dx, dy)
+            widget.move(dx, dy, moved=True)
 
         for element in self.elements:
-            element.move(dx, dy)
+            element.move(dx, dy, moved=True)
 
     def moveto(self, x: float, y: float) -> None:
         """Move the Widget to a certain position.
@@ -1015,10 +1287,42 @@ class Widget:
         """
         return self.move(x-self.position[0], y-self.position[1])
 
+    def _descendants(self) -> list[Widget]:
+        """Return the widget and all its child widgets in drawing order."""
+        widgets: list[Widget] = []
+        stack: list[Widget] = [self]
+
+        while stack:
+            widgets.append(widget := stack.pop())
+            stack.extend(reversed(widget.widgets))
+
+        return widgets
+
+    def lift(self) -> None:
+        """Lift the widget and its child widgets above all the others, both in
+        display and in event dispatch."""
+        for widget in (widgets := self._descendants()):
+            self.master.widgets.remove(widget)
+
+        self.master.widgets.extend(widgets)
+        self.master.tag_raise(self.tag)
+
+    def lower(self) -> None:
+        """Lower the widget and its child widgets below all the others, both
+        in display and in event dispatch."""
+        for widget in (widgets := self._descendants()):
+            self.master.widgets.remove(widget)
+
+        self.master.widgets[:0] = widgets
+        self.master.tag_lower(self.tag)
+
     def destroy(self) -> None:
         """Destroy the widget."""
         self.master.widgets.remove(self)
 
+        if self.master.spatial_index is not None:
+            self.master.spatial_index.remove(self)
+
         del self.feature, self.style
 
         if self.widget is not None:
@@ -1030,6 +1334,11 @@ class Widget:
         for element in self.elements:
             element.destroy()
 
+    def region(self) -> tuple[float, float, float, float]:
+        """Return the decision region of the `Widget`."""
+        x1, y1 = self.position[0]-self.offset[0], self.position[1]-self.offset[1]
+        return x1, y1, x1+self.size[0], y1+self.size[1]
+
     def detect(self, x: float, y: float) -> bool:
         """Detect whether the specified coordinates are within the `Widget`.
 
@@ -1047,12 +1356,15 @@ class Widget:
         *,
         zoom_position: bool = True,
         zoom_size: bool = True,
+        scaled: bool = False,
     ) -> None:
         """Zoom widget ifself.
 
         * `ratios`: ratios of zooming
         * `zoom_position`: whether or not to zoom the location of the widget
         * `zoom_size`: whether or not to zoom the size of the widget
+        * `scaled`: whether the items have been scaled together with the parent
+        widget
         """
         if not zoom_position and not zoom_size:
             warnings.warn("This is a no-effect call.", UserWarning, 2)
@@ -1067,10 +1379,16 @@ class Widget:
         if zoom_position:
             self.position = self.position[0]*ratios[0], self.position[1]*ratios[1]
 
+        self._update_index()
+
+        if zoom_position and zoom_size and not scaled:
+            self.master.scale(self.tag, 0, 0, *ratios)
+            scaled = True
+
         for widget in self.widgets:
-            widget.zoom(
-                ratios, zoom_position=zoom_position, zoom_size=zoom_size)
+            widget.zoom(ratios, zoom_position=zoom_position,
+                        zoom_size=zoom_size, scaled=scaled)
 
         for element in self.elements:
-            element.zoom(
-                ratios, zoom_position=zoom_position, zoom_size=zoom_size)
+            element.zoom(ratios, zoom_position=zoom_position,
+                         zoom_size=zoom_size, scaled=scaled)
@@ -13,9 +13,11 @@ __all__ = [
     "RadioBoxFeature",
     "ProgressBarFeature",
     "InputBoxFeature",
+    "TextBoxFeature",
     "SliderFeature",
     "SegmentedButtonFeature",
     "SpinBoxFeature",
+    "VirtualListFeature",
 ]
 
 import collections.abc
@@ -108,11 +110,11 @@ class Underline(ButtonFeature):
             self.widget.master.trigger_config.update(cursor=cursor)
             if self.widget.state == "normal":
                 self.widget.update("hover")
-                self.widget.texts[0].font.config(underline=True)
+                self.widget.texts[0].set_font(underline=True)
         else:
             if self.widget.state != "normal":
                 self.widget.update("normal")
-                self.widget.texts[0].font.config(underline=False)
+                self.widget.texts[0].set_font(underline=False)
         return flag
 
     def _button_1(self, _: tkinter.Event) -> bool:
@@ -124,7 +126,7 @@ class Underline(ButtonFeature):
         if flag := self.widget.texts[0].detect(event.x, event.y):
             if self.widget.state == "active":
                 self.widget.update("hover")
-                self.widget.texts[0].font.config(underline=True)
+                self.widget.texts[0].set_font(underline=True)
                 if self.command is not None:
                     self.command(*self._args)
         return flag
@@ -398,6 +400,88 @@ class InputBoxFeature(ButtonFeature):
         return flag
 
 
+class TextBoxFeature(virtual.Feature):
+    """Feature of text box"""
+
+    def _motion(self, event: tkinter.Event) -> bool:
+        if flag := self.widget.shapes[0].detect(event.x, event.y):
+            cursor = utility.fix_cursor(
+                "disabled" if self.widget.state == "disabled" else "xterm")
+            self.widget.master.trigger_config.update(cursor=cursor)
+            if self.widget.state == "normal":
+                self.widget.update("hover")
+        else:
+            if self.widget.state == "hover":
+                self.widget.update("normal")
+        return flag
+
+    def _button_1(self, event: tkinter.Event) -> bool:
+        if flag := self.widget.shapes[0].detect(event.x, event.y):
+            self.widget.update("active")
+            if self.widget.state == "active":  # Maybe widget is disabled
+                text = self.widget.texts[0]
+                index = text.cursor_find(event.x, event.y)
+                line, _ = text.table.position(index)  # It is a visible line
+                self.widget.master.trigger_focus.update(True, text.items[line - text.top])
+                text.cursor_set(index)
+        else:
+            if self.widget.state != "normal":
+                self.widget.update("normal")
+        return flag
+
+    def _b_1_motion(self, event: tkinter.Event) -> bool:
+        if flag := self.widget.state == "active":
+            self.widget.texts[0].cursor_set(self.widget.texts[0].cursor_find(event.x, event.y))
+        return flag
+
+    def _mouse_wheel(self, event: tkinter.Event) -> bool:
+        if flag := self.widget.shapes[0].detect(event.x, event.y):
+            self.widget.texts[0].scroll(-3 if event.delta > 0 else 3)
+        return flag
+
+    def _key_press(self, event: tkinter.Event) -> bool:
+        if self.widget.state == "active":
+            text = self.widget.texts[0]
+            index = text.cursor_get()
+            match event.keysym:
+                case "Right":
+                    text.cursor_move(1)
+                case "Left":
+                    text.cursor_move(-1)
+                case "Up":
+                    text.cursor_move_line(-1)
+                case "Down":
+                    text.cursor_move_line(1)
+                case "Prior":
+                    text.cursor_move_line(-len(text.items))
+                case "Next":
+                    text.cursor_move_line(len(text.items))
+                case "BackSpace":
+                    if index > 0:
+                        text.remove(index - 1)
+                        text.cursor_set(index - 1)
+                case "Delete":
+                    if index < len(text.table):
+                        text.remove(index)
+                        text.cursor_set(index)
+                case "Return" | "KP_Enter":
+                    text.insert(index, "\n")
+                    text.cursor_set(index + 1)
+                case _:
+                    if len(event.char) and event.char.isprintable():
+                        text.insert(index, event.char)
+                        text.cursor_set(index + 1)
+        return False
+
+    def _paste(self, _: tkinter.Event) -> bool:
+        if flag := self.widget.state == "active":
+            if value := self.widget.master.clipboard_get():
+                index = self.widget.texts[0].cursor_get()
+                self.widget.texts[0].insert(index, value)
+                self.widget.texts[0].cursor_set(index + len(value))
+        return flag
+
+
 class SliderFeature(virtual.Feature):
     """Feature of Slider"""
 
@@ -494,3 +578,12 @@ class SpinBoxFeature(virtual.Feature):
         if flag := self.widget.widgets[0].state == "active":
             self.command(event.delta > 0)
         return flag
+
+
+class VirtualListFeature(virtual.Feature):
+    """Feature of VirtualList"""
+
+    def _mouse_wheel(self, event: tkinter.Event) -> bool:
+        if flag := self.widget.shapes[0].detect(event.x, event.y):
+            self.widget.scroll(-3 if event.delta > 0 else 3)
+        return flag
@@ -7,6 +7,9 @@ __all__ = [
     # "Smoke",
 ]
 
+import concurrent.futures
+import pathlib
+
 import typing_extensions
 
 try:
@@ -37,6 +40,40 @@ class StillImage(virtual.Image):
 
         self.widget.master.coords(self.items[0], *self.center())
 
+    def load(
+        self,
+        file: str | pathlib.Path,
+        size: tuple[int, int] | None = None,
+        *,
+        placeholder: enhanced.PhotoImage | None = None,
+    ) -> concurrent.futures.Future:
+        """Load the image from a file in background.
+
+        * `file`: path of the image file
+        * `size`: size of the image, the original size if it is `None`
+        * `placeholder`: image displayed until the image is loaded
+        """
+        if placeholder is not None:
+            self._set_image(placeholder)
+
+        return enhanced.load_image_async(
+            file, size, self._set_image, master=self.widget.master)
+
+    def _set_image(self, image: enhanced.PhotoImage) -> None:
+        """Display a new image, which is scaled according to the canvas.
+
+        * `image`: the new image
+        """
+        if self.widget not in self.widget.master.widgets:
+            return  # The widget has been destroyed
+
+        self.initail_image = image
+        self.image = enhanced.image_cache.scale(
+            image, *getattr(self.widget.master, "ratios", (1, 1)))
+
+        for item in self.items:
+            self.widget.master.itemconfigure(item, image=self.image)
+
 
 class Smoke(virtual.Image):
     """A special Image with only one color"""
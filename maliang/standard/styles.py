@@ -16,6 +16,7 @@ __all__ = [
     "SegmentedButtonStyle",
     "SliderStyle",
     "SwitchStyle",
+    "TextBoxStyle",
     "TextStyle",
     "TooltipStyle",
     "SpinnerStyle",
@@ -361,6 +362,42 @@ class InputBoxStyle(virtual.Style):
         self.widget.update()
 
 
+class TextBoxStyle(InputBoxStyle):
+    """Style of TextBox"""
+
+    light = copy.deepcopy(InputBoxStyle.light)
+    dark = copy.deepcopy(InputBoxStyle.dark)
+
+    light["MultiLineText"] = light.pop("SingleLineText")
+    dark["MultiLineText"] = dark.pop("SingleLineText")
+
+    @typing_extensions.override
+    def set(
+        self,
+        theme: typing.Literal["light", "dark"] | None = None,
+        *,
+        fg: tuple[str | types.EllipsisType, ...] | str | None = None,
+        bg: tuple[str | types.EllipsisType, ...] | str | None = None,
+        ol: tuple[str | types.EllipsisType, ...] | str | None = None,
+        bg_bar: tuple[str | types.EllipsisType, ...] | str | None = None,
+    ) -> None:
+        """Set the style of the widget.
+
+        * `theme`: the theme name, None indicates both
+        * `fg`: the foreground color of the widget.
+        * `bg`: the background color of the widget.
+        * `ol`: the outline color of the widget.
+        * `bg_bar`: the highlight bar of the widget (Only for Windows11 theme)
+
+        states: "normal", "hover", "active"
+        """
+        self._set(theme, fg, fill="MultiLineText")
+        self._set(theme, bg, fill=("Rectangle", "RoundedRectangle.in"))
+        self._set(theme, ol, outline=("Rectangle", "RoundedRectangle.in"))
+        self._set(theme, bg_bar, fill="RoundedRectangle.out", outline="RoundedRectangle.out")
+        self.widget.update()
+
+
 class ToggleButtonStyle(virtual.Style):
     """Style of ToggleButton"""
 
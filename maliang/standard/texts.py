@@ -5,17 +5,18 @@ from __future__ import annotations
 __all__ = [
     "Information",
     "SingleLineText",
+    "MultiLineText",
 ]
 
 import bisect
 import itertools
 import math
-import tkinter.font
 import typing
 
 import typing_extensions
 
 from ..core import containers, virtual
+from ..toolbox import utility
 
 
 class _CanvasTextProxy:
@@ -23,6 +24,12 @@ class _CanvasTextProxy:
     def __init__(self, canvas: containers.Canvas, tag_or_id: str | int) -> None:
         self.canvas = canvas
         self.id = tag_or_id
+        # The widths of the prefixes of the text, which are updated on editing
+        # and built again when the font changes
+        self._prefix_widths: list[int] | None = None
+        self._char_widths: dict[str, int] = {}
+        self._font: str = ""
+        self._font_actual: tuple[typing.Any, ...] = ()
 
     def _get_index(self, index: int) -> int:
         if index < 0:
@@ -44,12 +51,19 @@ class _CanvasTextProxy:
         if show:
             value = show * len(value)
         self.canvas.itemconfigure(self.id, text=value)
+        self._prefix_widths = None
 
     def insert(self, index: int, value: str, *, show: str | None = None) -> None:
         """Insert"""
         if show:
             value = show * len(value)
-        self.canvas.insert(self.id, self._get_index(index), value)
+        index = self._get_index(index)
+        self.canvas.insert(self.id, index, value)
+
+        if (prefix := self._prefix_widths) is not None:
+            added = list(itertools.accumulate(self._measure(value), initial=prefix[index]))
+            delta = added[-1] - added[0]
+            prefix[index+1:] = added[1:] + [width + delta for width in prefix[index+1:]]
 
     def append(self, value: str, *, show: str | None = None) -> None:
         """Append"""
@@ -61,6 +75,10 @@ class _CanvasTextProxy:
         end = start + 1 if end is None else self._get_index(end)
         self.canvas.dchars(self.id, start, end - 1)  # including
 
+        if (prefix := self._prefix_widths) is not None and start < end:
+            delta = prefix[end] - prefix[start]
+            prefix[start+1:] = [width - delta for width in prefix[end+1:]]
+
     def pop(self, index: int = -1) -> None:
         """Pop"""
         value = self.get()[index := self._get_index(index)]
@@ -70,6 +88,7 @@ class _CanvasTextProxy:
     def clear(self) -> None:
         """Clear"""
         self.canvas.itemconfigure(self.id, text="")
+        self._prefix_widths = [0]
 
     def select_get(self) -> tuple[int, int] | None:
         """select get"""
@@ -111,17 +130,55 @@ class _CanvasTextProxy:
         """cursor find"""
         x1, *_ = self.canvas.bbox(self.id)
         x -= x1 + 1
-        font = tkinter.font.Font(font=self.canvas.itemcget(self.id, "font"))
-        index = bisect.bisect_right(tuple(itertools.accumulate(self.get())), x, key=font.measure)
+        prefix = self._get_prefix_widths()
+        index = max(0, bisect.bisect_right(prefix, x) - 1)
 
-        distance_left = abs(x - font.measure(self.get()[:index]))
-        distance_right = abs(x - font.measure(self.get()[:index+1]))
+        distance_left = abs(x - prefix[index])
+        distance_right = abs(x - prefix[min(index+1, len(prefix)-1)])
 
         if distance_right <= distance_left:
             index += 1
 
         return min(self.length(), index)
 
+    def measure(self, value: str) -> list[int]:
+        """measure"""
+        self._update_font()
+        return self._measure(value)
+
+    def width(self) -> int:
+        """width"""
+        return self._get_prefix_widths()[-1]
+
+    def _measure(self, value: str) -> list[int]:
+        """Return the widths of the characters with the font of the text"""
+        widths = self._char_widths
+
+        for char in value:
+            if char not in widths:
+                widths[char] = self.canvas.tk.getint(
+                    self.canvas.tk.call("font", "measure", self._font, char))
+
+        return [widths[char] for char in value]
+
+    def _update_font(self) -> None:
+        """Forget the measured widths if the font of the text changes"""
+        font = self.canvas.itemcget(self.id, "font")
+
+        if (actual := self.canvas.tk.call("font", "actual", font)) != self._font_actual:
+            self._font, self._font_actual = font, actual
+            self._char_widths.clear()
+            self._prefix_widths = None
+
+    def _get_prefix_widths(self) -> list[int]:
+        """Return the widths of the prefixes of the text"""
+        self._update_font()
+
+        if self._prefix_widths is None:
+            self._prefix_widths = list(itertools.accumulate(self._measure(self.get()), initial=0))
+
+        return self._prefix_widths
+
 
 class Information(virtual.Text):
     """General information text"""
@@ -268,12 +325,30 @@ class SingleLineText(virtual.Text):
     def _is_overflow(self) -> bool:
         """Whether the text content extends beyond the text box"""
         x1, _, x2, _ = self.widget.master.bbox(self.items[0])
-        width = (x2-x1) + self._get_margin()*2
+        return self._is_too_wide((x2-x1) + self._get_margin()*2)
+
+    def _is_too_wide(self, width: float) -> bool:
+        """Whether the width of the text with its margins exceeds the limit"""
         ratio = getattr(self.widget.master, "ratios", (1,))[0]
         if self.limit_width > 0:
             return width > self.limit_width*ratio
         return width >= self.size[0] + self.limit_width*ratio
 
+    def _count_fitting(self, value: str, width: int) -> int:
+        """Count the characters at the start of the value that can be added to
+        the displayed text of the width without overflow"""
+        # The bounding box of the text has 1 pixel on its left and right sides
+        extra = self._get_margin()*2 + 2
+        count = 0
+
+        for char_width in self.text_proxy.measure(self.show*len(value) if self.show else value):
+            width += char_width
+            if self._is_too_wide(width + extra):
+                break
+            count += 1
+
+        return count
+
     def _get_index(self, index: int) -> int:
         if index < 0:
             index += len(self.text)
@@ -299,21 +374,101 @@ class SingleLineText(virtual.Text):
             index = self._get_index(index)
             key = self.left + index
             self.text = self.text[:key] + value + self.text[key:]
-            self.text_proxy.insert(index, value, show=self.show)
+            length = self.text_proxy.length()
             self.right += len(value)
 
-            if index + len(value) == self.text_proxy.length():
+            # The visible part is found by the measured widths at first, so the
+            # displayed text is modified at most twice instead of per character
+            if index == length:
                 # Insert at the end
+                skip = max(0, self.right - self.left - self._count_fitting(
+                    self.text[self.left:self.right][::-1], 0))
+                if removed := min(skip, index):
+                    self.text_proxy.remove(0, removed)
+                self.text_proxy.insert(index - removed, value[skip-removed:], show=self.show)
+                self.left += skip
+
                 while self._is_overflow():
                     self.text_proxy.remove(0)
                     self.left += 1
+
+                # The text on the left fits exactly if the measured widths are
+                # exact, but a narrower character on the right may still fit
+                if self.left > 0 and not self._is_measured():
+                    self._extend_left()
+                self._extend_right()
             else:
+                visible = max(index, self._count_fitting(self.text[self.left:self.right], 0))
+                if visible >= index + len(value):
+                    self.text_proxy.insert(index, value, show=self.show)
+                    if visible < length + len(value):
+                        self.text_proxy.remove(visible, length + len(value))
+                else:
+                    self.text_proxy.remove(index, length)
+                    self.text_proxy.insert(index, value[:visible-index], show=self.show)
+                self.right = self.left + visible
+
                 while self._is_overflow():
                     self.text_proxy.remove(-1)
                     self.right -= 1
 
+                # There is spare width on the right only if all the displayed
+                # text fits, but the text on the left may fit after trimming
+                if visible == length + len(value) or not self._is_measured():
+                    self._extend_right()
+                self._extend_left()
+
         return flag
 
+    def _is_measured(self) -> bool:
+        """Whether the measured width of the displayed text is the actual one,
+        otherwise the visible part found by the measured widths is checked"""
+        x1, _, x2, _ = self.widget.master.bbox(self.items[0])
+        # The bounding box of the text has 1 pixel on its left and right sides
+        return x2 - x1 - 2 == self.text_proxy.width()
+
+    def _extend_right(self) -> None:
+        """Display more characters on the right while the text box has spare
+        width, the measured widths are used at first and then checked"""
+        if self.right == len(self.text):
+            return
+
+        if count := self._count_fitting(self.text[self.right:], self.text_proxy.width()):
+            self.text_proxy.append(self.text[self.right:self.right+count], show=self.show)
+            self.right += count
+
+        if self._is_measured():
+            return
+
+        while self.right < len(self.text) and not self._is_overflow():
+            self.text_proxy.append(self.text[self.right], show=self.show)
+            self.right += 1
+
+        while self._is_overflow():
+            self.text_proxy.remove(-1)
+            self.right -= 1
+
+    def _extend_left(self) -> None:
+        """Display more characters on the left while the text box has spare
+        width, the measured widths are used at first and then checked"""
+        if self.left == 0:
+            return
+
+        if count := self._count_fitting(self.text[:self.left][::-1], self.text_proxy.width()):
+            self.left -= count
+            self.text_proxy.insert(0, self.text[self.left:self.left+count], show=self.show)
+
+        if self._is_measured():
+            return
+
+        while self.left > 0 and not self._is_overflow():
+            self.left -= 1
+            self.text_proxy.insert(0, self.text[self.left], show=self.show)
+
+        while self._is_overflow():
+            self.text_proxy.remove(0)
+            self.left += 1
+
     def append(self, value: str) -> bool:
         """Add some characters to the text cursor"""
         return self.insert(len(self.text), value)
@@ -332,25 +487,8 @@ class SingleLineText(virtual.Text):
         self.text_proxy.remove(start, end)
         self.right -= end - start
 
-        if self.right < len(self.text):  # There is a string on the right
-            while not self._is_overflow():
-                if self.right == len(self.text):
-                    break
-                self.text_proxy.append(self.text[self.right], show=self.show)
-                self.right += 1
-            else:
-                self.text_proxy.remove(-1)
-                self.right -= 1
-
-        if self.left > 0:  # There is a string on the left
-            while not self._is_overflow():
-                if self.left == 0:
-                    break
-                self.left -= 1
-                self.text_proxy.insert(0, self.text[self.left], show=self.show)
-            else:
-                self.text_proxy.remove(0)
-                self.left += 1
+        self._extend_right()
+        self._extend_left()
 
         if not self.text_proxy.length():
             self.widget.master.itemconfigure(self.items[1], fill="#787878")
@@ -408,3 +546,239 @@ class SingleLineText(virtual.Text):
     def cursor_move_to(self, count: int) -> None:
         """Move the index position of the text cursor to a certain index"""
         return self.cursor_move(count - self.text_proxy.cursor_get())
+
+
+class MultiLineText(virtual.Text):
+    """Multi-line editable text
+
+    The text is stored in a piece table, and only the visible lines are
+    displayed by a fixed number of text items, which are reused when scrolling.
+    """
+
+    def __init__(
+        self,
+        widget: virtual.Widget,
+        relative_position: tuple[int, int] = (0, 0),
+        size: tuple[int, int] | None = None,
+        *,
+        text: str = "",
+        padding: int = 6,
+        family: str | None = None,
+        fontsize: int | None = None,
+        weight: typing.Literal["normal", "bold"] = "normal",
+        slant: typing.Literal["roman", "italic"] = "roman",
+        underline: bool = False,
+        overstrike: bool = False,
+        name: str | None = None,
+        gradient_animation: bool = True,
+        **kwargs,
+    ) -> None:
+        """
+        * `widget`: parent widget
+        * `relative_position`: position relative to its widgets
+        * `size`: size of element
+        * `text`: text value
+        * `padding`: spacing between the text and the border
+        * `family`: font family
+        * `fontsize`: font size
+        * `weight`: weight of the font
+        * `slant`: slant of the font
+        * `underline`: wether text is underline
+        * `overstrike`: wether text is overstrike
+        * `name`: name of element
+        * `gradient_animation`: Wether use animation to change color
+        * `kwargs`: extra parameters for CanvasItem
+        """
+        self.table = utility.PieceTable(text)
+        self.padding = padding
+        self.top: int = 0
+        self._cursor: int = 0
+        self._proxies: list[_CanvasTextProxy] = []
+        self._shown: list[str | None] = []
+        virtual.Text.__init__(
+            self, widget, relative_position, size, family=family, fontsize=fontsize,
+            weight=weight, slant=slant, underline=underline, overstrike=overstrike,
+            name=name, gradient_animation=gradient_animation, **kwargs)
+
+    @typing_extensions.override
+    def display(self) -> None:
+        """Display the `Element` on a `Canvas`"""
+        self.items = []  # The items of lines are created when it is resized
+
+    @typing_extensions.override
+    def coords(
+        self,
+        size: tuple[float, float] | None = None,
+        position: tuple[float, float] | None = None,
+    ) -> None:
+        """Resize the `Element`"""
+        super().coords(size, position)
+        self._layout()
+
+    @typing_extensions.override
+    def zoom(
+        self,
+        ratios: tuple[float, float],
+        *,
+        zoom_position: bool = True,
+        zoom_size: bool = True,
+        scaled: bool = False,
+    ) -> None:
+        """Scale the text"""
+        super().zoom(ratios, zoom_position=zoom_position, zoom_size=zoom_size, scaled=scaled)
+        self._layout()
+
+    @typing_extensions.override
+    def region(self) -> tuple[int, int, int, int]:
+        """Return the decision region of the `Text`."""
+        return virtual.Element.region(self)
+
+    def _layout(self) -> None:
+        """Create or delete the items of lines to fill the element, and place them"""
+        linespace = self.font.metrics("linespace")
+        count = max(1, int((self.size[1] - self.padding*2) // linespace))
+        created = False
+
+        while len(self.items) < count:
+            self.items.append(self.widget.master.create_text(
+                0, 0, text="", font=self.font, anchor="nw", tags=("fill", "fill"), **self.kwargs))
+            self.widget.tag_items(self.items[-1])
+            self._proxies.append(_CanvasTextProxy(self.widget.master, self.items[-1]))
+            created = True
+
+        while len(self.items) > count:
+            item = self.items.pop()
+            self._proxies.pop()
+            self._bindings.pop(item, None)
+            self._applied.pop(item, None)
+            self.widget.master.delete(item)
+
+        x, y = self.position[0] + self.padding, self.position[1] + self.padding
+
+        for i, item in enumerate(self.items):
+            self.widget.master.coords(item, x, y + i*linespace)
+
+        if created and self._shown:
+            self.update()
+
+        self._shown = [None] * count
+        self.scroll(0)
+
+    def _clip(self, line: str, widths: list[int]) -> str:
+        """Return the part of the line that can be displayed in the element"""
+        space = self.size[0] - self.padding*2
+
+        for i, width in enumerate(itertools.accumulate(widths)):
+            if width > space:
+                return line[:i]
+
+        return line
+
+    def _render(self) -> None:
+        """Display the visible lines, only the items whose lines are changed
+        are modified"""
+        lines = self.table.get_lines(self.top, self.top + len(self.items))
+        # All the lines have the same font, so they are measured together
+        widths = self._proxies[0].measure("".join(lines))
+        start = 0
+
+        for i, proxy in enumerate(self._proxies):
+            line = ""
+            if i < len(lines):
+                line = self._clip(lines[i], widths[start:start+len(lines[i])])
+                start += len(lines[i])
+            if self._shown[i] != line:
+                self._shown[i] = line
+                proxy.set(line)
+
+        self._show_cursor()
+
+    def _show_cursor(self) -> None:
+        """Display the text cursor on the item of its line if it is visible"""
+        if self.widget.state != "active":
+            return
+
+        line, column = self.table.position(self._cursor)
+
+        if 0 <= line - self.top < len(self.items):
+            proxy = self._proxies[line - self.top]
+            proxy.cursor_set(min(column, proxy.length()))
+        else:
+            self.widget.master.focus("")
+
+    def get(self) -> str:
+        """Get text of the element"""
+        return str(self.table)
+
+    def set(self, value: str) -> None:
+        """Set text of the element"""
+        self.table = utility.PieceTable(value)
+        self.top = self._cursor = 0
+        self._render()
+
+    def insert(self, index: int, value: str) -> None:
+        """Insert text to the location of the specified index"""
+        self.table.insert(index, value)
+        if index <= self._cursor:
+            self._cursor += len(value)
+        self._render()
+
+    def append(self, value: str) -> None:
+        """Add some characters to the end of the text"""
+        self.insert(len(self.table), value)
+
+    def remove(self, start: int, end: int | None = None) -> None:
+        """Remove text within the specified index range"""
+        end = start + 1 if end is None else end
+        self.table.delete(start, end)
+        if self._cursor >= end:
+            self._cursor -= end - start
+        elif self._cursor > start:
+            self._cursor = start
+        self.top = min(self.top, self.table.line_count - 1)
+        self._render()
+
+    def clear(self) -> None:
+        """Clear"""
+        self.set("")
+
+    def scroll(self, count: int) -> None:
+        """Scroll the text by some lines, the negative count scrolls up"""
+        self.top = max(0, min(self.top + count, self.table.line_count - len(self.items)))
+        self._render()
+
+    def see(self, index: int) -> None:
+        """Scroll the text to make the character of the index visible"""
+        line, _ = self.table.position(index)
+        if line < self.top:
+            self.scroll(line - self.top)
+        elif line >= self.top + len(self.items):
+            self.scroll(line - self.top - len(self.items) + 1)
+
+    def cursor_get(self) -> int:
+        """Get the index of the text cursor"""
+        return self._cursor
+
+    def cursor_set(self, index: int) -> None:
+        """Set the index of the text cursor and make it visible"""
+        self._cursor = max(0, min(index, len(self.table)))
+        self.see(self._cursor)
+        self._show_cursor()
+
+    def cursor_move(self, count: int) -> None:
+        """Move the text cursor by some characters"""
+        self.cursor_set(self._cursor + count)
+
+    def cursor_move_line(self, count: int) -> None:
+        """Move the text cursor by some lines and keep its column"""
+        line, column = self.table.position(self._cursor)
+        line = max(0, min(line + count, self.table.line_count - 1))
+        length = len(self.table.get_lines(line, line + 1)[0])
+        self.cursor_set(self.table.index(line, min(column, length)))
+
+    def cursor_find(self, x: float, y: float) -> int:
+        """Get the index of the character nearest to the location"""
+        linespace = self.font.metrics("linespace")
+        row = max(0, min(int((y - self.position[1] - self.padding) // linespace), len(self.items) - 1))
+        line = min(self.top + row, self.table.line_count - 1)
+        return self.table.index(line, self._proxies[line - self.top].cursor_find(x))
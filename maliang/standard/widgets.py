@@ -9,6 +9,7 @@ __all__ = [
     "Button",
     "Switch",
     "InputBox",
+    "TextBox",
     "ToggleButton",
     "CheckBox",
     "RadioBox",
@@ -21,6 +22,7 @@ __all__ = [
     "SpinBox",
     "OptionButton",
     "ComboBox",
+    "VirtualList",
     "Spinner",
     "Tooltip",
 ]
@@ -28,6 +30,7 @@ __all__ = [
 import collections.abc
 import itertools
 import math
+import pathlib
 import typing
 import warnings
 
@@ -109,6 +112,8 @@ class Image(virtual.Widget):
         size: tuple[int, int] | None = None,
         *,
         image: enhanced.PhotoImage | None = None,
+        file: str | pathlib.Path | None = None,
+        placeholder: enhanced.PhotoImage | None = None,
         anchor: typing.Literal["n", "e", "w", "s", "nw", "ne", "sw", "se", "center"] = "nw",
         capture_events: bool | None = None,
         gradient_animation: bool | None = None,
@@ -120,6 +125,9 @@ class Image(virtual.Widget):
         * `position`: position of the widget
         * `size`: size of the widget
         * `image`: image of the widget
+        * `file`: path of the image file, which is loaded in background
+        * `placeholder`: image displayed until the image of `file` is loaded,
+        a transparent image of `size` if it is `None`
         * `anchor`: anchor of the widget
         * `capture_events`: wether detect another widget under the widget
         * `gradient_animation`: wether enable gradient_animation
@@ -132,11 +140,17 @@ class Image(virtual.Widget):
             auto_update=auto_update, style=style)
         # The above parameter `anchor` has no practical effect and is only used
         # to query the data of the widget.
+        if file is not None:
+            if placeholder is None:
+                placeholder = enhanced.PhotoImage.transparent(*(size or (1, 1)))
+            image = placeholder
         if image is not None and size is not None:
-            images.StillImage(self, anchor=anchor, image=image.scale(
+            still_image = images.StillImage(self, anchor=anchor, image=image.scale(
                 size[0]/image.width(), size[1]/image.height()))
         else:
-            images.StillImage(self, anchor=anchor, image=image)
+            still_image = images.StillImage(self, anchor=anchor, image=image)
+        if file is not None:
+            still_image.load(file, size)
 
     def get(self) -> enhanced.PhotoImage:
         """Get the image of the widget"""
@@ -149,7 +163,7 @@ class Image(virtual.Widget):
         self.images[0].initail_image = image
         if image is not None:
             self.master.update()
-            image = image.scale(*self.master.ratios)
+            image = enhanced.image_cache.scale(image, *self.master.ratios)
         self.images[0].image = image
         self.master.itemconfigure(self.images[0].items[0], image=image)
 
@@ -469,6 +483,86 @@ class InputBox(virtual.Widget):
         self.texts[0].clear()
 
 
+class TextBox(virtual.Widget):
+    """Text box widget, generally used to edit long text on multiple lines"""
+
+    def __init__(
+        self,
+        master: containers.Canvas | virtual.Widget,
+        position: tuple[int, int],
+        size: tuple[int, int] = (400, 300),
+        *,
+        text: str = "",
+        family: str | None = None,
+        fontsize: int | None = None,
+        weight: typing.Literal['normal', 'bold'] = "normal",
+        slant: typing.Literal['roman', 'italic'] = "roman",
+        underline: bool = False,
+        overstrike: bool = False,
+        anchor: typing.Literal["n", "e", "w", "s", "nw", "ne", "sw", "se", "center"] = "nw",
+        capture_events: bool | None = None,
+        gradient_animation: bool | None = None,
+        auto_update: bool | None = None,
+        style: type[virtual.Style] | None = None,
+    ) -> None:
+        """
+        * `master`: parent canvas
+        * `position`: position of the widget
+        * `size`: size of the widget
+        * `text`: text of the widget
+        * `family`: font family
+        * `fontsize`: font size
+        * `weight`: weight of the text
+        * `slant`: slant of the text
+        * `underline`: whether the text is underline
+        * `overstrike`: whether the text is overstrike
+        * `anchor`: anchor of the widget
+        * `capture_events`: wether detect another widget under the widget
+        * `gradient_animation`: wether enable gradient_animation
+        * `auto_update`: whether the theme manager update it automatically
+        * `style`: style of the widget
+        """
+        virtual.Widget.__init__(
+            self, master, position, size, anchor=anchor,
+            capture_events=capture_events, gradient_animation=gradient_animation,
+            auto_update=auto_update, style=style)
+        if style is None:
+            self.style = styles.TextBoxStyle(self)
+        if configs.Env.system == "Windows10":
+            shapes.Rectangle(self)
+        else:
+            shapes.RoundedRectangle(self, name=".out")
+            shapes.RoundedRectangle(self, name=".in", size=(self.size[0], self.size[1]-3))
+        texts.MultiLineText(
+            self, text=text, family=family, fontsize=fontsize, weight=weight, slant=slant,
+            underline=underline, overstrike=overstrike)
+        self.feature = features.TextBoxFeature(self)
+
+    def get(self) -> str:
+        """Get the text of the widget"""
+        return self.texts[0].get()
+
+    def set(self, value: str) -> None:
+        """Set the text of the widget"""
+        self.texts[0].set(value)
+
+    def insert(self, index: int, value: str) -> None:
+        """Insert text to the location of the specified index"""
+        self.texts[0].insert(index, value)
+
+    def append(self, value: str) -> None:
+        """Append text to the end"""
+        self.texts[0].append(value)
+
+    def remove(self, start: int, end: int | None = None) -> None:
+        """Remove text within the specified index range"""
+        self.texts[0].remove(start, end)
+
+    def clear(self) -> None:
+        """Clear the text of the widget"""
+        self.texts[0].clear()
+
+
 class CheckBox(virtual.Widget):
     """Checkbox button widget, generally used to check some options"""
 
@@ -1099,9 +1193,8 @@ class SegmentedButton(virtual.Widget):
         self.value: int | None = None
         if not sizes:
             if text:
-                sizes = tuple(utility.get_text_size(
-                    text, fontsize, family, weight=weight, slant=slant, padding=6, master=master
-                ) for text in text)
+                sizes = tuple(utility.get_text_sizes(
+                    text, fontsize, family, weight=weight, slant=slant, padding=6, master=master))
             else:
                 sizes = (utility.get_text_size(
                     "", fontsize, family, weight=weight, slant=slant, padding=6, master=master),)
@@ -1318,8 +1411,8 @@ class OptionButton(virtual.Widget):
         * `style`: style of the widget
         """
         if size is None:
-            size = sorted(utility.get_text_size(t, fontsize, family, weight=weight,
-                          slant=slant, padding=6, master=master) for t in (list(text) + [""]))[-1]
+            size = max(utility.get_text_sizes(list(text) + [""], fontsize, family, weight=weight,
+                       slant=slant, padding=6, master=master))
         self.text = text
         virtual.Widget.__init__(
             self, master, position, size, anchor=anchor,
@@ -1358,18 +1451,7 @@ class OptionButton(virtual.Widget):
 
     def _open_options(self) -> None:
         """Open the options"""
-        self.master.widgets.remove(self._segmented_button)
-        self.master.widgets.append(self._segmented_button)
-        for element in self._segmented_button.elements:
-            for item in element.items:
-                self.master.lift(item)
-        for widget in self._segmented_button.widgets:
-            self.master.widgets.remove(widget)
-            self.master.widgets.append(widget)
-            for element in widget.elements:
-                for item in element.items:
-                    self.master.lift(item)
-
+        self._segmented_button.lift()
         self._segmented_button.forget(False)
 
     def _close_options(self, index: int | None = None) -> None:
@@ -1441,8 +1523,8 @@ class ComboBox(virtual.Widget):
         * `style`: style of the widget
         """
         if size is None:
-            size = sorted(utility.get_text_size(t, fontsize, family, weight=weight,
-                          slant=slant, padding=6, master=master) for t in (list(text) + [""]))[-1]
+            size = max(utility.get_text_sizes(list(text) + [""], fontsize, family, weight=weight,
+                       slant=slant, padding=6, master=master))
             size = size[0] + size[1] - 10, size[1]
         self.text = text
         virtual.Widget.__init__(
@@ -1483,18 +1565,7 @@ class ComboBox(virtual.Widget):
 
     def _open_options(self) -> None:
         """Open the options"""
-        self.master.widgets.remove(self._segmented_button)
-        self.master.widgets.append(self._segmented_button)
-        for element in self._segmented_button.elements:
-            for item in element.items:
-                self.master.lift(item)
-        for widget in self._segmented_button.widgets:
-            self.master.widgets.remove(widget)
-            self.master.widgets.append(widget)
-            for element in widget.elements:
-                for item in element.items:
-                    self.master.lift(item)
-
+        self._segmented_button.lift()
         self._segmented_button.forget(False)
 
     def _close_options(self, index: int | None = None) -> None:
@@ -1516,6 +1587,129 @@ class ComboBox(virtual.Widget):
             self.command(value)
 
 
+class VirtualList(virtual.Widget):
+    """A list widget that only creates the rows which can be seen, suitable for
+    displaying a large amount of data"""
+
+    def __init__(
+        self,
+        master: containers.Canvas | virtual.Widget,
+        position: tuple[int, int],
+        size: tuple[int, int] = (400, 300),
+        *,
+        count: int = 0,
+        source: collections.abc.Callable[[int], str] = str,
+        row_height: int | None = None,
+        padding: int = 4,
+        family: str | None = None,
+        fontsize: int | None = None,
+        weight: typing.Literal['normal', 'bold'] = "normal",
+        slant: typing.Literal['roman', 'italic'] = "roman",
+        command: collections.abc.Callable[[int], typing.Any] | None = None,
+        anchor: typing.Literal["n", "e", "w", "s", "nw", "ne", "sw", "se", "center"] = "nw",
+        capture_events: bool | None = None,
+        gradient_animation: bool | None = None,
+        auto_update: bool | None = None,
+        style: type[virtual.Style] | None = None,
+    ) -> None:
+        """
+        * `master`: parent canvas
+        * `position`: position of the widget
+        * `size`: size of the widget
+        * `count`: number of rows of the data
+        * `source`: a function that returns the text of a row by its index
+        * `row_height`: height of each row
+        * `padding`: extra padding between the rows and the border
+        * `family`: font family
+        * `fontsize`: font size
+        * `weight`: weight of the text
+        * `slant`: slant of the text
+        * `command`: a function that is triggered when a row is clicked, with the index of the row
+        * `anchor`: anchor of the widget
+        * `capture_events`: wether detect another widget under the widget
+        * `gradient_animation`: wether enable gradient_animation
+        * `auto_update`: whether the theme manager update it automatically
+        * `style`: style of the widget
+        """
+        if row_height is None:
+            row_height = utility.get_text_size(
+                "", fontsize, family, weight=weight, slant=slant, padding=6, master=master)[1]
+        virtual.Widget.__init__(
+            self, master, position, size, anchor=anchor,
+            capture_events=capture_events, gradient_animation=gradient_animation,
+            auto_update=auto_update, style=style)
+        if style is None:
+            self.style = styles.LabelStyle(self)
+        if configs.Env.system == "Windows10":
+            shapes.Rectangle(self)
+        else:
+            shapes.RoundedRectangle(self)
+        self.count = count
+        self.source = source
+        self.command = command
+        self.top = 0
+        for i in range(max(1, int((size[1] - 2*padding) // row_height))):
+            Button(self, (padding-self.offset[0], padding+i*row_height-self.offset[1]),
+                   (size[0] - 2*padding, row_height), family=family, fontsize=fontsize,
+                   weight=weight, slant=slant, command=lambda row=i: self._click(row))
+        self.feature = features.VirtualListFeature(self)
+        self.refresh()
+
+    @property
+    def row_height(self) -> float:
+        """Return the height of the rows, which is zoomed with the widget"""
+        return self.widgets[0].size[1]
+
+    def _click(self, row: int) -> None:
+        """Trigger the command with the index of the clicked row"""
+        if self.command is not None:
+            self.command(self.top + row)
+
+    def refresh(self, count: int | None = None) -> None:
+        """Pull the visible rows from the data source again.
+
+        * `count`: new number of rows of the data, None indicates unchanged
+        """
+        if count is not None:
+            self.count = count
+        self.top = max(0, min(self.top, self.count - len(self.widgets)))
+        for i, row in enumerate(self.widgets):
+            if (index := self.top + i) < self.count:
+                row.set(self.source(index))
+                if row.disappeared and not self.disappeared:
+                    row.forget(False)
+            elif not row.disappeared:
+                row.forget()
+
+    def scroll(self, count: int) -> None:
+        """Scroll the rows.
+
+        * `count`: number of rows to scroll, positive values scroll down
+        """
+        top = max(0, min(self.top + count, self.count - len(self.widgets)))
+        if top != self.top:
+            self.top = top
+            self.refresh()
+
+    def see(self, index: int) -> None:
+        """Scroll the rows so that the row of the index is visible.
+
+        * `index`: index of the row
+        """
+        if index < self.top:
+            self.scroll(index - self.top)
+        elif index >= self.top + len(self.widgets):
+            self.scroll(index - self.top - len(self.widgets) + 1)
+
+    @typing_extensions.override
+    def forget(self, value: bool = True, /) -> None:
+        """Let all elements of the widget to forget, the rows are pulled from
+        the data source again when it is shown"""
+        virtual.Widget.forget(self, value)
+        if not value:
+            self.refresh()
+
+
 class Spinner(virtual.Widget):
     """Spinners visually communicate that something is processing"""
 
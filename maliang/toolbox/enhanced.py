@@ -4,15 +4,59 @@ from __future__ import annotations
 
 __all__ = [
     "PhotoImage",
+    "load_image_async",
 ]
 
-import functools
+import collections
+import concurrent.futures
+import pathlib
+import queue
 import tkinter
+import tkinter.font
+import traceback
+import typing
 
 try:
-    from PIL import ImageTk
+    from PIL import Image, ImageTk
 except ImportError:
-    ImageTk = None
+    Image = ImageTk = None
+
+
+def _get_factors(old: int, new: int) -> tuple[int, int] | None:
+    """Return the factors of zoom and subsample of Tk that scale a length of
+    image to another exactly, or `None` if the ratio is not simple enough.
+
+    * `old`: the original length
+    * `new`: the new length
+    """
+    for subsample in range(1, 9):
+        zoom = round(new * subsample / old)
+
+        # The length of the result needs to cover the new length
+        if zoom and -(-old // subsample) * zoom >= new and abs(old*zoom/subsample - new) < 1:
+            return zoom, subsample
+
+    return None
+
+
+def _get_runs(old: int, new: int) -> list[list[int]]:
+    """Return the runs of nearest-neighbor sampling, each run is a source
+    index and the range of the target indexes that use it.
+
+    * `old`: the original length
+    * `new`: the new length
+    """
+    runs: list[list[int]] = []
+
+    for i in range(new):
+        source = int(i * old / new)
+
+        if runs and runs[-1][0] == source:
+            runs[-1][2] = i + 1
+        else:
+            runs.append([source, i, i + 1])
+
+    return runs
 
 
 if ImageTk is None:
@@ -20,17 +64,14 @@ if ImageTk is None:
     class PhotoImage(tkinter.PhotoImage):
         """Enhanced version of `tkinter.PhotoImage`."""
 
-        @functools.cached_property
-        def _data(self) -> list[list[str]]:
-            """Return image data in the form of a string."""
-            return [line.split() for line in self.tk.call(self, "data")]
+        @classmethod
+        def transparent(cls, width: int, height: int) -> PhotoImage:
+            """Create a transparent PhotoImage.
 
-        @functools.cached_property
-        def _transparency_data(self) -> list[list[bool]]:
-            """Return transparency data of the image."""
-            return [[self.transparency_get(x, y)
-                    for x in range(self.width())]
-                    for y in range(self.height())]
+            * `width`: The width of the image
+            * `height`: The height of the image
+            """
+            return cls(width=width, height=height)
 
         def scale(self, x: float, y: float) -> PhotoImage:
             """Scale the PhotoImage.
@@ -45,16 +86,30 @@ if ImageTk is None:
 
             * `width`: The new width of the image
             * `height`: The new height of the image
+
+            The image is resampled by Tk. Simple ratios are done by a single
+            copy with zoom and subsample, others are done by copying the
+            columns and then the rows of the image in bulk.
             """
-            x, y = width/self.width(), height/self.height()
+            old_width, old_height = self.width(), self.height()
             new_image = PhotoImage(width=width, height=height)
-            new_image.put([[self._data[int(j/y)][int(i/x)]
-                            for i in range(width)] for j in range(height)])
+            x, y = _get_factors(old_width, width), _get_factors(old_height, height)
+
+            if x is not None and y is not None:
+                self.tk.call(
+                    new_image, "copy", self, "-zoom", x[0], y[0],
+                    "-subsample", x[1], y[1], "-compositingrule", "set")
+                return new_image
 
-            for i in range(width):
-                for j in range(height):
-                    if self._transparency_data[int(j/y)][int(i/x)]:
-                        new_image.transparency_set(i, j, True)
+            temp_image = PhotoImage(width=width, height=old_height)
+            self.tk.eval("\n".join(
+                f"{temp_image} copy {self} -from {i} 0 {i+1} {old_height} "
+                f"-to {start} 0 {stop} {old_height} -compositingrule set"
+                for i, start, stop in _get_runs(old_width, width)))
+            self.tk.eval("\n".join(
+                f"{new_image} copy {temp_image} -from 0 {j} {width} {j+1} "
+                f"-to 0 {start} {width} {stop} -compositingrule set"
+                for j, start, stop in _get_runs(old_height, height)))
 
             return new_image
 
@@ -63,6 +118,15 @@ else:
     class PhotoImage(ImageTk.PhotoImage, tkinter.PhotoImage):
         """Pillow version of `tkinter.PhotoImage`."""
 
+        @classmethod
+        def transparent(cls, width: int, height: int) -> PhotoImage:
+            """Create a transparent PhotoImage.
+
+            * `width`: The width of the image
+            * `height`: The height of the image
+            """
+            return cls("RGBA", (width, height))
+
         def scale(self, x: float, y: float) -> PhotoImage:
             """Scale the PhotoImage.
 
@@ -78,3 +142,331 @@ else:
             * `height`: The new height of the image
             """
             return PhotoImage(ImageTk.getimage(self).resize((width, height)))
+
+
+class ImageCache:
+    """LRU cache of scaled images, bounded by the memory of the images.
+
+    The images are keyed by the name of the source image and the target size,
+    so the source image should not be modified after it is scaled.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024**2) -> None:
+        """
+        * `max_bytes`: the budget of the cache, one pixel takes four bytes
+        """
+        self.max_bytes = max_bytes
+
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evicted_bytes: int = 0
+
+        self._images: collections.OrderedDict[tuple[str, int, int], PhotoImage] = collections.OrderedDict()
+        self._bytes: int = 0
+
+    def __len__(self) -> int:
+        return len(self._images)
+
+    @property
+    def bytes(self) -> int:
+        """Returns the memory of the cached images."""
+        return self._bytes
+
+    def resize(self, image: PhotoImage, width: int, height: int) -> PhotoImage:
+        """Return the resized image, which is cached.
+
+        * `image`: the source image
+        * `width`: the new width of the image
+        * `height`: the new height of the image
+        """
+        key = str(image), width, height
+
+        if (new_image := self._images.get(key)) is not None:
+            self.hits += 1
+            self._images.move_to_end(key)
+            return new_image
+
+        self.misses += 1
+        new_image = image.resize(width, height)
+        size = width * height * 4
+
+        if size <= self.max_bytes:
+            self._images[key] = new_image
+            self._bytes += size
+            self._evict()
+
+        return new_image
+
+    def scale(self, image: PhotoImage, x: float, y: float) -> PhotoImage:
+        """Return the scaled image, which is cached.
+
+        * `image`: the source image
+        * `x`: The x-axis scale factor
+        * `y`: The y-axis scale factor
+        """
+        return self.resize(image, round(x*image.width()), round(y*image.height()))
+
+    def clear(self) -> None:
+        """Remove all the cached images."""
+        self._images.clear()
+        self._bytes = 0
+
+    def _evict(self) -> None:
+        """Remove the least recently used images until the budget is met."""
+        while self._bytes > self.max_bytes:
+            (_, width, height), _ = self._images.popitem(last=False)
+            self._bytes -= width * height * 4
+            self.evicted_bytes += width * height * 4
+
+
+image_cache = ImageCache()
+"""The cache of the scaled images of `virtual.Image`."""
+
+
+_FontKey = tuple[tkinter.Misc, str, int, str, str, bool, bool]
+
+
+class FontRegistry:
+    """Interned fonts, which are shared by the texts with the same options and
+    deleted when they are no longer referenced.
+
+    The size in the key of a font is the size before zooming, the actual size
+    of the font is changed by `scale`, once for all the texts that share it.
+    """
+
+    def __init__(self) -> None:
+        self._fonts: dict[_FontKey, tkinter.font.Font] = {}
+        self._counts: dict[_FontKey, int] = {}
+        self._sizes: dict[_FontKey, int] = {}
+        self._keys: dict[str, _FontKey] = {}
+
+    def __len__(self) -> int:
+        return len(self._fonts)
+
+    def acquire(
+        self,
+        master: tkinter.Misc,
+        family: str,
+        size: int,
+        weight: str = "normal",
+        slant: str = "roman",
+        underline: bool = False,
+        overstrike: bool = False,
+    ) -> tkinter.font.Font:
+        """Return the font with the options, and increase its reference count.
+
+        * `master`: the widget that uses the font
+        * `family`: font family
+        * `size`: font size before zooming
+        * `weight`: weight of the font
+        * `slant`: slant of the font
+        * `underline`: wether text is underline
+        * `overstrike`: wether text is overstrike
+        """
+        key = master, family, size, weight, slant, bool(underline), bool(overstrike)
+
+        if (font := self._fonts.get(key)) is None:
+            font = tkinter.font.Font(
+                master, family=family, size=size, weight=weight, slant=slant,
+                underline=underline, overstrike=overstrike)
+            self._fonts[key] = font
+            self._counts[key] = 0
+            self._sizes[key] = size
+            self._keys[font.name] = key
+
+        self._counts[key] += 1
+        return font
+
+    def release(self, font: tkinter.font.Font) -> None:
+        """Decrease the reference count of the font, and delete it if the count
+        reaches zero.
+
+        * `font`: the font acquired before
+        """
+        if (key := self._keys.get(font.name)) is None:
+            return
+
+        self._counts[key] -= 1
+
+        if not self._counts[key]:
+            self._remove(key)
+
+    def replace(self, font: tkinter.font.Font, **options: typing.Any) -> tkinter.font.Font:
+        """Return the font with some options changed, which replaces a font
+        acquired before. The font is changed in place if it is not shared.
+
+        * `font`: the font acquired before
+        * `options`: the options to change, the size is the size before zooming
+        """
+        key = self._keys[font.name]
+        master, family, size, weight, slant, underline, overstrike = key
+        new_key = (
+            master, options.get("family", family), options.get("size", size),
+            options.get("weight", weight), options.get("slant", slant),
+            bool(options.get("underline", underline)),
+            bool(options.get("overstrike", overstrike)))
+
+        if new_key == key:
+            return font
+
+        if self._counts[key] > 1 or new_key in self._fonts:
+            new_font = self.acquire(*new_key)
+            self.release(font)
+            return new_font
+
+        font.config(**options)
+        self._fonts[new_key] = self._fonts.pop(key)
+        self._counts[new_key] = self._counts.pop(key)
+        current_size = self._sizes.pop(key)
+        self._sizes[new_key] = options.get("size", current_size)
+        self._keys[font.name] = new_key
+
+        return font
+
+    def scale(self, font: tkinter.font.Font, factor: float) -> None:
+        """Set the actual size of the font by the factor of its size.
+
+        * `font`: the font acquired before
+        * `factor`: the factor of the size before zooming
+        """
+        if (key := self._keys.get(font.name)) is None:
+            return
+
+        if (size := round(key[2]*factor)) != self._sizes[key]:
+            font.config(size=size)
+            self._sizes[key] = size
+
+    def clear(self, master: tkinter.Misc) -> None:
+        """Remove all the fonts used by a widget.
+
+        * `master`: the widget that uses the fonts
+        """
+        for key in [key for key in self._fonts if key[0] is master]:
+            self._remove(key)
+
+    def _remove(self, key: _FontKey) -> None:
+        """Remove the font from the registry, the Tcl font is deleted when the
+        `Font` object is no longer used."""
+        del self._keys[self._fonts.pop(key).name]
+        del self._counts[key], self._sizes[key]
+
+
+font_registry = FontRegistry()
+"""The registry of the fonts of `virtual.Text` and `Canvas.create_text`."""
+
+
+_POLL_INTERVAL = 10
+"""The interval in milliseconds to check the images loaded in background."""
+
+_executor: concurrent.futures.ThreadPoolExecutor | None = None
+_loaded: dict[tkinter.Misc, queue.SimpleQueue[tuple[
+    concurrent.futures.Future, tuple[int, int] | None,
+    typing.Callable[[PhotoImage], typing.Any], tkinter.Misc]]] = {}
+_pending: dict[tkinter.Misc, int] = {}
+_poll_ids: dict[tkinter.Misc, str] = {}
+
+
+def _decode(file: str | pathlib.Path, size: tuple[int, int] | None) -> typing.Any:
+    """Decode and resize the image in a worker thread. Without Pillow only the
+    file is read, and the decoding is left to Tk.
+
+    * `file`: path of the image file
+    * `size`: new size of the image
+    """
+    if Image is None:
+        return pathlib.Path(file).read_bytes()
+
+    with Image.open(file) as image:
+        if size is not None:
+            return image.resize(size)
+        return image.copy()
+
+
+def _poll(root: tkinter.Misc) -> None:
+    """Hand back the loaded images to the callbacks in the Tk thread.
+
+    * `root`: the root window that schedules the polling
+    """
+    _poll_ids.pop(root, None)
+    loaded = _loaded[root]
+
+    while True:
+        try:
+            future, size, callback, target = loaded.get_nowait()
+        except queue.Empty:
+            break
+
+        _pending[root] -= 1
+
+        if future.cancelled():
+            continue
+
+        try:
+            if Image is None:
+                image = PhotoImage(data=future.result(), master=target)
+                if size is not None:
+                    image = image.resize(*size)
+            else:
+                image = PhotoImage(future.result(), master=target)
+            callback(image)
+        except Exception as exc:  # pylint: disable=W0718
+            traceback.print_exception(exc)
+
+    if _pending[root]:
+        _poll_ids[root] = root.after(_POLL_INTERVAL, _poll, root)
+
+
+def _forget_root(root: tkinter.Misc) -> None:
+    """Discard the polling state of a destroyed root window, the images still
+    loading for it are never handed back.
+
+    * `root`: the root window
+    """
+    _loaded.pop(root, None)
+    _pending.pop(root, None)
+    _poll_ids.pop(root, None)
+
+
+def load_image_async(
+    file: str | pathlib.Path,
+    size: tuple[int, int] | None = None,
+    callback: typing.Callable[[PhotoImage], typing.Any] = lambda _: None,
+    *,
+    master: tkinter.Misc | None = None,
+) -> concurrent.futures.Future:
+    """Load an image in background and call back with it in the Tk thread.
+
+    * `file`: path of the image file
+    * `size`: new size of the image, the original size if it is `None`
+    * `callback`: function called with the loaded `PhotoImage`
+    * `master`: the widget whose Tk thread the image is handed back to
+
+    The image is decoded and resized by Pillow on a thread pool. The returned
+    future can be used to cancel the loading.
+    """
+    global _executor  # pylint: disable=W0603
+
+    if master is None:
+        master = tkinter._get_default_root()
+
+    # The polling is scheduled on the root window, which outlives the master
+    root = master.nametowidget(".")
+
+    if root not in _loaded:
+        _loaded[root] = queue.SimpleQueue()
+        _pending[root] = 0
+        root.bind("<Destroy>", lambda event: _forget_root(root)
+                  if event.widget is root else None, add="+")
+
+    if _executor is None:
+        _executor = concurrent.futures.ThreadPoolExecutor(thread_name_prefix="maliang-image")
+
+    loaded = _loaded[root]
+    future = _executor.submit(_decode, file, size)
+    future.add_done_callback(lambda f: loaded.put((f, size, callback, master)))
+    _pending[root] += 1
+
+    if root not in _poll_ids:
+        _poll_ids[root] = root.after(_POLL_INTERVAL, _poll, root)
+
+    return future
@@ -8,11 +8,13 @@ __all__ = [
     "load_font",
     "screen_size",
     "get_text_size",
+    "get_text_sizes",
     "fix_cursor",
     "create_smoke",
 ]
 
 import atexit
+import bisect
 import collections.abc
 import ctypes
 import os
@@ -80,6 +82,333 @@ class Trigger:
             self._command(*args, **kwargs)
 
 
+class SpatialIndex:
+    """Uniform grid of the regions of widgets.
+
+    It is used by `containers.Canvas` to find the widgets that are related to
+    a pointer event without walking through all of its widgets.
+    """
+
+    def __init__(self, cell_size: int = 100, *, max_cells: int = 64) -> None:
+        """
+        * `cell_size`: side length of a cell of the grid
+        * `max_cells`: a widget covering more cells than this is always returned
+        """
+        self.cell_size = cell_size
+        self.max_cells = max_cells
+        self.active: set[virtual.Widget] = set()
+
+        self._cells: dict[tuple[int, int], set[virtual.Widget]] = {}
+        self._keys: dict[virtual.Widget, tuple[tuple[int, int], ...]] = {}
+        self._large: set[virtual.Widget] = set()
+        self._pinned: set[virtual.Widget] = set()
+
+    def __contains__(self, widget: virtual.Widget) -> bool:
+        return widget in self._keys or widget in self._large
+
+    def __len__(self) -> int:
+        return len(self._keys) + len(self._large)
+
+    def insert(
+        self,
+        widget: virtual.Widget,
+        region: tuple[float, float, float, float],
+    ) -> None:
+        """Insert a widget, or update its region if it is already inserted.
+
+        * `widget`: the widget
+        * `region`: the region of the widget, (x1, y1, x2, y2)
+        """
+        self._discard(widget)
+
+        x1, y1, x2, y2 = (int(value // self.cell_size) for value in region)
+
+        if (x2-x1+1) * (y2-y1+1) > self.max_cells:
+            self._large.add(widget)
+            return
+
+        keys = tuple((i, j) for i in range(x1, x2+1) for j in range(y1, y2+1))
+        self._keys[widget] = keys
+
+        for key in keys:
+            self._cells.setdefault(key, set()).add(widget)
+
+    def remove(self, widget: virtual.Widget) -> None:
+        """Remove a widget.
+
+        * `widget`: the widget
+        """
+        self._discard(widget)
+        self._pinned.discard(widget)
+        self.active.discard(widget)
+
+    def pin(self, widget: virtual.Widget) -> None:
+        """Make the widget always be returned, wherever the pointer is.
+
+        * `widget`: the widget
+        """
+        self._pinned.add(widget)
+
+    def query(self, x: float, y: float) -> set[virtual.Widget]:
+        """Return the widgets that may be related to the specified coordinates.
+
+        * `x`: x-coordinate of the location
+        * `y`: y-coordinate of the location
+        """
+        key = int(x // self.cell_size), int(y // self.cell_size)
+        return self._cells.get(key, set()) | self._large | self._pinned | self.active
+
+    def query_region(self, region: tuple[float, float, float, float]) -> set[virtual.Widget]:
+        """Return the widgets that may overlap the specified region.
+
+        * `region`: the region, (x1, y1, x2, y2)
+        """
+        x1, y1, x2, y2 = (int(value // self.cell_size) for value in region)
+        result = set(self._large)
+
+        if (x2-x1+1) * (y2-y1+1) > len(self._cells):
+            for (i, j), cell in self._cells.items():
+                if x1 <= i <= x2 and y1 <= j <= y2:
+                    result |= cell
+        else:
+            for i in range(x1, x2+1):
+                for j in range(y1, y2+1):
+                    result |= self._cells.get((i, j), set())
+
+        return result
+
+    def clear(self) -> None:
+        """Remove all widgets."""
+        self._cells.clear()
+        self._keys.clear()
+        self._large.clear()
+        self._pinned.clear()
+        self.active.clear()
+
+    def _discard(self, widget: virtual.Widget) -> None:
+        """Discard the region of a widget.
+
+        * `widget`: the widget
+        """
+        self._large.discard(widget)
+
+        for key in self._keys.pop(widget, ()):
+            cell = self._cells[key]
+            cell.discard(widget)
+
+            if not cell:
+                del self._cells[key]
+
+
+class PieceTable:
+    """Text stored as pieces of immutable buffers.
+
+    Inserting and deleting only split the pieces around the location instead
+    of copying the whole text, and lines are located by the positions of the
+    line breaks in the buffers, so editing a long text does not depend on its
+    length.
+    """
+
+    chunk_size: int = 1024
+    """The maximum length of an added buffer that is extended by typing."""
+
+    def __init__(self, text: str = "") -> None:
+        """
+        * `text`: the initial text
+        """
+        self._buffers: list[str] = []
+        self._breaks: list[list[int]] = []
+        # Each piece is [buffer, start, end, number of line breaks]
+        self._pieces: list[list[int]] = []
+        self._length: int = 0
+        self._line_count: int = 1
+
+        self.insert(0, text)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __str__(self) -> str:
+        return self.get()
+
+    @property
+    def line_count(self) -> int:
+        """Returns the number of lines."""
+        return self._line_count
+
+    def get(self, start: int = 0, end: int | None = None) -> str:
+        """Return the text in the range.
+
+        * `start`: start index of the range
+        * `end`: end index of the range (excluded), the end of the text if it is `None`
+        """
+        if end is None:
+            end = self._length
+
+        parts: list[str] = []
+        offset = 0
+
+        for buffer, piece_start, piece_end, _ in self._pieces:
+            if offset >= end:
+                break
+
+            length = piece_end - piece_start
+
+            if offset + length > start:
+                parts.append(self._buffers[buffer][
+                    piece_start + max(0, start-offset):piece_start + min(length, end-offset)])
+
+            offset += length
+
+        return "".join(parts)
+
+    def get_lines(self, first: int, last: int) -> list[str]:
+        """Return the lines in the range, without the line breaks.
+
+        * `first`: index of the first line
+        * `last`: index of the last line (excluded)
+        """
+        first, last = max(0, first), min(last, self._line_count)
+
+        if first >= last:
+            return []
+
+        end = self._length if last == self._line_count else self.index(last) - 1
+        return self.get(self.index(first), end).split("\n")
+
+    def index(self, line: int, column: int = 0) -> int:
+        """Return the index of a position of the text.
+
+        * `line`: index of the line
+        * `column`: index of the character in the line
+        """
+        if line <= 0:
+            return column
+
+        offset = 0
+
+        for buffer, start, end, breaks in self._pieces:
+            if line <= breaks:
+                first = bisect.bisect_left(self._breaks[buffer], start)
+                return offset + self._breaks[buffer][first+line-1] - start + 1 + column
+
+            line -= breaks
+            offset += end - start
+
+        raise IndexError("line index out of range")
+
+    def position(self, index: int) -> tuple[int, int]:
+        """Return the line and column of an index of the text.
+
+        * `index`: index of the text
+        """
+        line = offset = 0
+
+        for buffer, start, end, breaks in self._pieces:
+            if index <= offset + end - start:
+                line += self._count_breaks(buffer, start, start + index - offset)
+                break
+
+            line += breaks
+            offset += end - start
+
+        return line, index - self.index(line)
+
+    def insert(self, index: int, text: str) -> None:
+        """Insert text at the index.
+
+        * `index`: index of the text
+        * `text`: the text to insert
+        """
+        if not text:
+            return
+
+        i = self._split(index)
+        breaks = self._find_breaks(text)
+
+        if i > 0 and (piece := self._pieces[i-1])[0] == len(self._buffers) - 1 \
+                and piece[2] == len(self._buffers[-1]) < self.chunk_size:
+            # Extend the last added buffer when typing
+            self._breaks[-1].extend(piece[2] + position for position in breaks)
+            self._buffers[-1] += text
+            piece[2] += len(text)
+            piece[3] += len(breaks)
+        else:
+            self._buffers.append(text)
+            self._breaks.append(breaks)
+            self._pieces.insert(i, [len(self._buffers)-1, 0, len(text), len(breaks)])
+
+        self._length += len(text)
+        self._line_count += len(breaks)
+
+    def delete(self, start: int, end: int) -> None:
+        """Delete the text in the range.
+
+        * `start`: start index of the range
+        * `end`: end index of the range (excluded)
+        """
+        if start >= end:
+            return
+
+        i, j = self._split(start), self._split(end)
+
+        for _, piece_start, piece_end, breaks in self._pieces[i:j]:
+            self._length -= piece_end - piece_start
+            self._line_count -= breaks
+
+        del self._pieces[i:j]
+
+    def _split(self, index: int) -> int:
+        """Split the piece at the index, and return the index of the piece that
+        starts from the index.
+
+        * `index`: index of the text
+        """
+        if not 0 <= index <= self._length:
+            raise IndexError("string index out of range")
+
+        offset = 0
+
+        for i, (buffer, start, end, _) in enumerate(self._pieces):
+            if index == offset:
+                return i
+
+            if index < offset + end - start:
+                middle = start + index - offset
+                self._pieces[i] = [buffer, start, middle, self._count_breaks(buffer, start, middle)]
+                self._pieces.insert(i+1, [buffer, middle, end, self._count_breaks(buffer, middle, end)])
+                return i + 1
+
+            offset += end - start
+
+        return len(self._pieces)
+
+    def _count_breaks(self, buffer: int, start: int, end: int) -> int:
+        """Count the line breaks of a buffer in the range.
+
+        * `buffer`: index of the buffer
+        * `start`: start index of the range
+        * `end`: end index of the range (excluded)
+        """
+        breaks = self._breaks[buffer]
+        return bisect.bisect_left(breaks, end) - bisect.bisect_left(breaks, start)
+
+    @staticmethod
+    def _find_breaks(text: str) -> list[int]:
+        """Return the positions of the line breaks of the text.
+
+        * `text`: the text
+        """
+        breaks: list[int] = []
+        position = text.find("\n")
+
+        while position >= 0:
+            breaks.append(position)
+            position = text.find("\n", position + 1)
+
+        return breaks
+
+
 def get_parent(widget: tkinter.Misc) -> int:
     """Get the HWND of `tkinter.Widget`.
 
@@ -168,25 +497,99 @@ def screen_size() -> tuple[int, int]:
     return width, height
 
 
-def get_text_size(
+# The description of a font: (family, size, other options)
+_FontKey = tuple[str, int, tuple[tuple[str, typing.Any], ...]]
+
+# The fonts to measure texts, keyed by the root windows that own them
+_fonts: dict[tkinter.Misc, dict[_FontKey, tuple[tkinter.font.Font, int]]] = {}
+# The measured sizes, keyed by the descriptions of the fonts and the texts
+_sizes: dict[tuple[str, int, tuple[tuple[str, typing.Any], ...], str], tuple[int, int]] = {}
+
+
+def _get_font(
+    root: tkinter.Misc,
+    family: str,
+    fontsize: int,
+    options: tuple[tuple[str, typing.Any], ...],
+) -> tuple[tkinter.font.Font, int]:
+    """Return the font to measure texts and its line spacing. The fonts of a
+    root window are cached until it is destroyed.
+
+    * `root`: the root window of the font
+    * `family`: font family of the font
+    * `fontsize`: font size of the font
+    * `options`: other options of the font
+    """
+    if (fonts := _fonts.get(root)) is None:
+        fonts = _fonts[root] = {}
+        root.bind("<Destroy>", lambda event: _fonts.pop(root, None)
+                  if event.widget is root else None, add="+")
+
+    key = family, fontsize, options
+
+    if (value := fonts.pop(key, None)) is None:
+        font = tkinter.font.Font(root, family=family, size=fontsize, **dict(options))
+        value = font, font.metrics("linespace")
+
+        if len(fonts) >= 64:
+            del fonts[next(iter(fonts))]  # The least recently used one
+
+    fonts[key] = value
+    return value
+
+
+def _measure(
+    root: tkinter.Misc,
+    family: str,
+    fontsize: int,
+    options: tuple[tuple[str, typing.Any], ...],
     text: str,
+) -> tuple[int, int]:
+    """Return the size of the bounding box of a text item on a Canvas. The
+    sizes are cached for all root windows.
+
+    * `root`: the root window to measure the text if it is not cached
+    * `family`: font family of the text
+    * `fontsize`: font size of the text
+    * `options`: other options of the font
+    * `text`: the text
+    """
+    key = family, fontsize, options, text
+
+    if (size := _sizes.pop(key, None)) is None:
+        font, linespace = _get_font(root, family, fontsize, options)
+        lines = text.split("\n")
+        # The bounding box of a text item has 1 pixel on its left and right
+        # sides for the insertion cursor
+        size = max(map(font.measure, lines)) + 2, linespace*len(lines)
+
+        if len(_sizes) >= 4096:
+            del _sizes[next(iter(_sizes))]  # The least recently used one
+
+    _sizes[key] = size
+    return size
+
+
+def get_text_sizes(
+    texts: collections.abc.Iterable[str],
     fontsize: int | None = None,
     family: str | None = None,
     *,
     padding: int = 0,
     master: tkinter.Canvas | virtual.Widget | None = None,
     **kwargs,
-) -> tuple[int, int]:
-    """Get the size of a text with a special font family and font size.
+) -> list[tuple[int, int]]:
+    """Get the sizes of some texts with a special font family and font size.
 
-    * `text`: the text
-    * `fontsize`: font size of the text
-    * `family`: font family of the text
-    * `padding`: extra padding of the size
+    * `texts`: the texts
+    * `fontsize`: font size of the texts
+    * `family`: font family of the texts
+    * `padding`: extra padding of the sizes
     * `master`: default canvas or widget provided
     * `kwargs`: kwargs of `tkinter.font.Font`
 
-    This function only works when the fontsize is negative number!
+    The texts are measured by the font instead of creating text items, and the
+    results are cached.
     """
     if family is None:
         family = configs.Font.family
@@ -194,20 +597,39 @@ def get_text_size(
         fontsize = configs.Font.size
 
     fontsize = -abs(fontsize)
-    temp_cv = master if master else tkinter.Canvas(configs.Env.root)
 
-    while isinstance(temp_cv, virtual.Widget):
-        temp_cv = temp_cv.master
+    while isinstance(master, virtual.Widget):
+        master = master.master
 
-    font = tkinter.font.Font(temp_cv, family=family, size=fontsize, **kwargs)
-    item = temp_cv.create_text(-9999, -9999, text=text, font=font)
-    x1, y1, x2, y2 = temp_cv.bbox(item)
-    temp_cv.delete(item)
+    root = (master if master else configs.Env.root).nametowidget(".")
+    options = tuple(sorted(kwargs.items()))
 
-    if master is None:
-        temp_cv.destroy()
+    return [(2*padding + width, 2*padding + height) for width, height in (
+        _measure(root, family, fontsize, options, text) for text in texts)]
 
-    return 2*padding + x2 - x1, 2*padding + y2 - y1
+
+def get_text_size(
+    text: str,
+    fontsize: int | None = None,
+    family: str | None = None,
+    *,
+    padding: int = 0,
+    master: tkinter.Canvas | virtual.Widget | None = None,
+    **kwargs,
+) -> tuple[int, int]:
+    """Get the size of a text with a special font family and font size.
+
+    * `text`: the text
+    * `fontsize`: font size of the text
+    * `family`: font family of the text
+    * `padding`: extra padding of the size
+    * `master`: default canvas or widget provided
+    * `kwargs`: kwargs of `tkinter.font.Font`
+
+    This function only works when the fontsize is negative number!
+    """
+    return get_text_sizes(
+        (text,), fontsize, family, padding=padding, master=master, **kwargs)[0]
 
 
 def fix_cursor(name: str, /) -> str:
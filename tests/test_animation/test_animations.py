@@ -1,10 +1,13 @@
 # pylint: disable=all
 
+import time
 import tkinter
 import unittest
+import unittest.mock
 
 from maliang.animation import animations
-from maliang.core import containers
+from maliang.color import convert
+from maliang.core import configs, containers
 from maliang.standard import widgets
 
 
@@ -114,6 +117,52 @@ class TestAnimation(unittest.TestCase):
         self.assertEqual(len(an._tasks), 3+2)
         an.stop()
 
+    def test_key(self) -> None:
+        an = animations.Animation(60, lambda _: None)
+        an2 = animations.Animation(60, lambda _: None)
+        an.key = an2.key = ("target", "property")
+
+        an.start()
+        an2.start()
+        self.assertFalse(an.active)
+        self.assertTrue(an2.active)
+        self.assertIs(animations._registry[an2.key], an2)
+        an2.stop()
+        self.assertNotIn(an2.key, animations._registry)
+
+    def test_shared_clock(self) -> None:
+        self.addCleanup(setattr, configs.Env, "shared_clock", configs.Env.shared_clock)
+        configs.Env.shared_clock = True
+        values, ends = [], []
+
+        def command(p) -> None:
+            if not values:
+                time.sleep(0.05)  # the next frames are late
+            values.append(p)
+
+        an = animations.Animation(100, command, fps=50, end=lambda: ends.append(None), repeat=1)
+        an2 = animations.Animation(100, lambda _: None)
+        self.addCleanup(an.stop)
+
+        an.start()
+        an2.start()
+        self.assertTrue(an.active)
+        self.assertTrue(an2.active)
+        an2.stop()
+        self.assertFalse(an2.active)
+
+        deadline = time.perf_counter() + 5
+        while an.active and time.perf_counter() < deadline:
+            self.tk.update()
+
+        self.assertFalse(an.active)
+        self.assertEqual(ends, [None, None])  # repeat
+        self.assertEqual(values[-1], 1)
+        self.assertEqual(an.frames_rendered + an.frames_dropped, 10)
+        self.assertGreaterEqual(an.frames_dropped, 1)  # late frames are collapsed
+        self.assertGreater(an.max_lateness, 20)
+        self.assertEqual(an.count, 1)
+
 
 class TestMoveWindow_Tk(unittest.TestCase):
 
@@ -258,6 +307,29 @@ class TestGradientItem(unittest.TestCase):
         self.an.start()
         self.assertRaises(ValueError, lambda: animations.GradientItem(self.cv, self.item, "fill", ("", ""), 1000))
 
+    def test_colors(self) -> None:
+        self.an = animations.GradientItem(self.cv, self.item, "fill", ("#000000", "#FFFFFF"), 100, fps=50)
+        an2 = animations.GradientItem(self.cv, self.item, "outline", ("#000000", "#FFFFFF"), 100, fps=50)
+        self.assertIs(self.an._colors, an2._colors)
+        self.assertEqual(list(self.an._colors.values()), ["#333333", "#666666", "#999999", "#CCCCCC", "#FFFFFF"])
+        self.an.command(1)
+        self.assertEqual(self.cv.itemcget(self.item, "fill"), "#FFFFFF")
+
+    def test_shared_clock(self) -> None:
+        self.addCleanup(setattr, configs.Env, "shared_clock", configs.Env.shared_clock)
+        configs.Env.shared_clock = True
+        self.an = animations.GradientItem(self.cv, self.item, "fill", ("#000000", "#FFFFFF"), 100, fps=50)
+
+        with unittest.mock.patch.object(convert, "rgb_to_hex", wraps=convert.rgb_to_hex) as rgb_to_hex:
+            self.an.start()
+            deadline = time.perf_counter() + 5
+            while self.an.active and time.perf_counter() < deadline:
+                self.tk.update()
+
+        self.assertFalse(self.an.active)
+        rgb_to_hex.assert_not_called()  # all frames are looked up in the table
+        self.assertEqual(self.cv.itemcget(self.item, "fill"), "#FFFFFF")
+
 
 class TestScaleFontSize(unittest.TestCase):
 
@@ -283,6 +355,12 @@ class TestScaleFontSize(unittest.TestCase):
         self.an4 = animations.ScaleFontSize(self.widget.texts[0], (11.1, 22.2), 99)
         self.an4.start()
 
+    def test_before_configure(self) -> None:
+        text = self.widget.texts[0]
+        self.an1 = self.an2 = self.an3 = self.an4 = animations.ScaleFontSize(text, 30, 99)
+        self.an1.command(1)
+        self.assertEqual(text.font.cget("size"), -30)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -3,6 +3,7 @@
 import colorsys
 import tkinter
 import unittest
+import unittest.mock
 
 from maliang.color import convert
 
@@ -70,6 +71,11 @@ class TestCase(unittest.TestCase):
         self.assertEqual(convert.hex_to_name("#FFFFFF"), ["gray100", "grey100", "white"])
         self.assertEqual(convert.hex_to_name("#008000"), ["green"])
 
+    def test_nearest_name(self) -> None:
+        self.assertEqual(convert.nearest_name((254, 254, 254)), ["gray100", "grey100", "white"])
+        self.assertEqual(convert.nearest_name((0, 128, 0)), ["green"])
+        self.assertEqual(convert.nearest_name((1, 127, 2)), ["green"])
+
     def test_fix_hex_length(self) -> None:
         self.assertEqual(convert.fix_hex_length("#FFF"), "#FFFFFF")
         self.assertEqual(convert.fix_hex_length("#00ff00"), "#00ff00")  
@@ -80,6 +86,44 @@ class TestCase(unittest.TestCase):
         self.assertEqual(convert.str_to_rgb("#00ff00"), (0, 255, 0))
         self.assertEqual(convert.str_to_rgb("Blue"), (0, 0, 255))
 
+    def test_rgb_to_hex_many(self) -> None:
+        self.assertEqual(convert.rgb_to_hex_many([(255, 0, 16), (0, 128, 0)]), ["#FF0010", "#008000"])
+        self.assertEqual(convert.rgb_to_hex_many([]), [])
+        values = [(254.5, 0.4, 15.6), (0, 127.5, 0.5)]
+        with unittest.mock.patch.object(convert, "numpy", None):
+            expected = convert.rgb_to_hex_many(values)
+        self.assertEqual(expected, ["#FE0010", "#008000"])
+        self.assertEqual(convert.rgb_to_hex_many(values), expected)
+
+    def test_hex_to_rgb_many(self) -> None:
+        self.assertEqual(convert.hex_to_rgb_many(["#FF0010", "#008000"]), [(255, 0, 16), (0, 128, 0)])
+        with unittest.mock.patch.object(convert, "numpy", None):
+            self.assertEqual(convert.hex_to_rgb_many(["#FF0010", "#008000"]), [(255, 0, 16), (0, 128, 0)])
+        self.assertEqual(convert.hex_to_rgb_many(iter(["#abcdef"])), [(171, 205, 239)])
+        self.assertEqual(convert.hex_to_rgb_many([]), [])
+        self.assertEqual(convert.hex_to_rgb_many(["#ABCDEFF", "#ABCDE"]), [convert.hex_to_rgb("#ABCDEFF"), convert.hex_to_rgb("#ABCDE")])
+
+    def test_cache(self) -> None:
+        convert.cache_clear()
+        self.assertEqual(convert.cache_info()["str_to_rgb"].currsize, 0)
+        self.assertEqual(convert.str_to_rgb("#ABC"), (170, 187, 204))
+        self.assertEqual(convert.str_to_rgb("#ABC"), (170, 187, 204))
+        self.assertEqual(convert.cache_info()["str_to_rgb"].hits, 1)
+        self.assertEqual(convert.cache_info()["fix_hex_length"].misses, 1)
+        convert.cache_clear()
+        self.assertEqual(convert.cache_info()["str_to_rgb"].currsize, 0)
+
+    def test_cache_reuse(self) -> None:
+        convert.cache_clear()
+        convert.str_to_rgb("#ABCDEF")
+        convert.str_to_rgb("#ABCDEF")
+        info = convert.cache_info()
+        self.assertEqual((info["str_to_rgb"].hits, info["str_to_rgb"].misses), (1, 1))
+        # The second call returns before parsing the code again
+        self.assertEqual((info["hex_to_rgb"].hits, info["hex_to_rgb"].misses), (0, 1))
+        self.assertEqual((info["fix_hex_length"].hits, info["fix_hex_length"].misses), (0, 1))
+        convert.cache_clear()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -31,6 +31,12 @@ class TestCase(unittest.TestCase):
         self.assertEqual(hsl.gradient((0, 0, 0), (1, 1, 1), 2, contoller=lambda _: 1), [(1, 1, 1), (1, 1, 1)])
         self.assertEqual(hsl.gradient((0, 0, 0), (1, 1, 1), 2, channels=(True, True, False)), [(0, 0, 0), (0.5, 0.5, 0)])
 
+    def test_blend_array(self) -> None:
+        self.assertEqual(hsl.blend_array([(0, 0, 0), (1, 1, 1)], [1, 3]), (0.75, 0.75, 0.75))
+
+    def test_gradient_array(self) -> None:
+        self.assertEqual(hsl.gradient_array((0, 0, 0), (1, 1, 1), 2), [(0, 0, 0), (0.5, 0.5, 0.5)])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,6 +1,7 @@
 # pylint: disable=all
 
 import unittest
+import unittest.mock
 
 from maliang.color import rgb
 
@@ -25,6 +26,16 @@ class TestCase(unittest.TestCase):
         self.assertEqual(rgb.gradient((0, 0, 0), (100, 100, 100), 2, contoller=lambda _: 1), [(100, 100, 100), (100, 100, 100)])
         self.assertEqual(rgb.gradient((0, 0, 0), (100, 100, 100), 2, channels=(True, True, False)), [(0, 0, 0), (50, 50, 0)])
 
+    def test_blend_array(self) -> None:
+        self.assertEqual(rgb.blend_array([(0, 0, 0), (255, 255, 255)]), (128, 128, 128))
+        self.assertEqual(rgb.blend_array([(0, 0, 0), (100, 100, 100)], [3, 7]), (70, 70, 70))
+
+    def test_gradient_array(self) -> None:
+        self.assertEqual(rgb.gradient_array((0, 0, 0), (100, 100, 100), 3, 0.6), [(0, 0, 0), (20, 20, 20), (40, 40, 40)])
+        self.assertEqual(rgb.gradient_array((0, 0, 0), (100, 100, 100), 2, channels=(True, True, False)), [(0, 0, 0), (50, 50, 0)])
+        with unittest.mock.patch.object(rgb, "numpy", None):
+            self.assertEqual(rgb.gradient_array((0, 0, 0), (100, 100, 100), 3, 0.6), [(0, 0, 0), (20, 20, 20), (40, 40, 40)])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -13,6 +13,7 @@ class TestEnv(unittest.TestCase):
         configs.Env.theme = "dark"
         configs.Env.gradient_animation = False
         configs.Env.auto_update = False
+        configs.Env.shared_clock = True
 
         configs.Env.reset()
 
@@ -20,6 +21,7 @@ class TestEnv(unittest.TestCase):
         self.assertEqual(configs.Env.theme, "light")
         self.assertTrue(configs.Env.gradient_animation)
         self.assertTrue(configs.Env.auto_update)
+        self.assertFalse(configs.Env.shared_clock)
 
     def test_get_default_system(self) -> None:
         with unittest.mock.patch('sys.platform', 'win32'):
@@ -100,6 +100,16 @@ class TestTk(unittest.TestCase):
                 with containers.Canvas(tk):
                     tk.theme("dark", include_children=True, include_canvases=True)
 
+    def test_theme_time_slice(self) -> None:
+        with containers.Tk() as tk:
+            with containers.Canvas(tk, theme_time_slice=1):
+                with unittest.mock.patch.object(tk, "update") as update:
+                    tk.theme("dark")
+                    update.assert_not_called()
+            with unittest.mock.patch.object(tk, "update") as update:
+                tk.theme("light")
+                update.assert_called_once()
+
     def test_at_exit(self) -> None:
         a = None
 
@@ -181,6 +191,15 @@ class TestCanvas(unittest.TestCase):
                 with containers.Canvas(cv):
                     cv.theme("dark")
 
+    def test_get_bg_rgb(self) -> None:
+        with containers.Tk() as tk:
+            with containers.Canvas(tk, bg="#000000") as cv:
+                self.assertEqual(cv.get_bg_rgb(), (0, 0, 0))
+                cv.configure(bg="#FFFFFF")
+                self.assertEqual(cv.get_bg_rgb(), (255, 255, 255))
+                cv["background"] = "#FF0000"
+                self.assertEqual(cv.get_bg_rgb(), (255, 0, 0))
+
     def test_initialization(self) -> None:
         with containers.Tk() as tk:
             for anchor in "nw", "n", "w", "ne", "sw", "e", "s", "se", "center":
@@ -248,6 +267,137 @@ class TestCanvas(unittest.TestCase):
                 event.x = 1
                 cv.on_key_release(event)
 
+    def test_spatial_index(self) -> None:
+        with containers.Tk() as tk:
+            with containers.Canvas(tk, spatial_index=True) as cv:
+                near = widgets.Button(cv, (0, 0), (100, 40))
+                far = widgets.Button(cv, (1000, 1000), (100, 40))
+                event = tkinter.Event()
+                event.x, event.y = 10, 10
+                self.assertEqual(cv._get_targets(event), [near])
+                cv.on_motion(event, "<Motion>")
+                self.assertEqual(near.state, "hover")
+                event.x, event.y = 500, 500
+                self.assertEqual(cv._get_targets(event), [near])
+                cv.on_motion(event, "<Motion>")
+                self.assertEqual(near.state, "normal")
+                self.assertEqual(cv._get_targets(event), [])
+                far.moveto(490, 490)
+                self.assertEqual(cv._get_targets(event), [far])
+                far.forget()
+                self.assertEqual(cv._get_targets(event), [])
+                far.forget(False)
+                far.destroy()
+                self.assertEqual(cv._get_targets(event), [])
+
+    def test_deferred_rendering(self) -> None:
+        with containers.Tk() as tk:
+            with containers.Canvas(tk, deferred_rendering=True) as cv:
+                item = cv.create_rectangle(0, 0, 10, 10, fill="red")
+                cv.coords(item, 10, 10, 20, 20)
+                cv.move(item, 5, 5)
+                cv.itemconfigure(item, fill="blue")
+                self.assertEqual(cv.coords(item), [15., 15., 25., 25.])
+                self.assertEqual(cv.itemcget(item, "fill"), "blue")
+                cv.move(item, 5, 5)
+                cv.itemconfigure(item, {"fill": "green"})
+                cv.flush()
+                self.assertEqual(cv.coords(item), [20., 20., 30., 30.])
+                self.assertEqual(cv.itemcget(item, "fill"), "green")
+                options = {"dash": (4, 2), "tags": ("a", "b"), "activefill": None}
+                with containers.Canvas(tk) as plain:
+                    plain_item = plain.create_rectangle(0, 0, 10, 10)
+                    plain.itemconfigure(plain_item, **options)
+                    cv.itemconfigure(item, **options)
+                    cv.flush()
+                    for key in options:
+                        self.assertEqual(cv.itemcget(item, key), plain.itemcget(plain_item, key))
+
+    def test_resample_delay(self) -> None:
+        with containers.Tk() as tk:
+            with containers.Canvas(tk, auto_zoom=True, resample_delay=10) as cv:
+                image = widgets.Image(cv, (0, 0), image=enhanced.PhotoImage(width=10, height=10)).images[0]
+                cv.place(width=100, height=100)
+                cv._initialization()
+                cv.place(width=200, height=200)
+                cv.update()
+                cv._zoom_self()
+                self.assertIs(image.image, image.initail_image)
+                self.assertIsNotNone(cv._resample_id)
+                cv._resample()
+                self.assertEqual(image.image.width(), 20)
+
+    def test_viewport_culling(self) -> None:
+        with containers.Tk() as tk:
+            with containers.Canvas(tk, viewport_culling=True) as cv:
+                cv.place(width=200, height=200)
+                cv.configure(scrollregion=(0, 0, 2000, 2000))
+                cv.update()
+                near = widgets.Button(cv, (0, 0), (100, 40))
+                far = widgets.Button(cv, (1000, 1000), (100, 40))
+                cv.cull()
+                self.assertFalse(near.culled)
+                self.assertTrue(far.culled)
+                self.assertEqual(cv.itemcget(far.shapes[0].items[0], "state"), "hidden")
+                cv.xview_moveto(0.5)
+                cv.yview_moveto(0.5)
+                self.assertIsNotNone(cv._cull_id)
+                cv.cull()
+                self.assertTrue(near.culled)
+                self.assertFalse(far.culled)
+                self.assertEqual(cv.itemcget(far.shapes[0].items[0], "state"), "normal")
+
+    def test_theme_time_slice(self) -> None:
+        with containers.Tk() as tk:
+            with containers.Canvas(tk, theme_time_slice=1) as cv:
+                cv.place(width=200, height=200)
+                cv.update()
+                near = widgets.Button(cv, (0, 0), (100, 40))
+                far = [widgets.Button(cv, (0, 1000 + i*50), (100, 40)) for i in range(100)]
+                done = []
+                with unittest.mock.patch.object(near, "update") as near_update, \
+                        unittest.mock.patch.object(far[-1], "update") as far_update:
+                    cv.theme("light", callback=lambda: done.append(1))
+                    near_update.assert_called_once()
+                    far_update.assert_not_called()
+                    self.assertIsNotNone(cv._theme_id)
+                    while not done:
+                        tk.update()
+                    far_update.assert_called_once_with(gradient_animation=False, nested=False)
+                self.assertEqual(done, [1])
+                self.assertIsNone(cv._theme_id)
+
+    def test_widget_tags(self) -> None:
+        with containers.Tk() as tk:
+            with containers.Canvas(tk) as cv:
+                spin_box = widgets.SpinBox(cv, (0, 0))
+                button = widgets.Button(cv, (0, 0))
+                item = spin_box.widgets[1].shapes[0].items[0]
+                self.assertIn(spin_box.tag, cv.gettags(item))
+                self.assertIn(spin_box.widgets[1].tag, cv.gettags(item))
+                self.assertEqual(len(cv.find_withtag(spin_box.tag)), sum(
+                    len(element.items) for widget in spin_box._descendants() for element in widget.elements))
+                x, y = cv.coords(item)[:2]
+                spin_box.move(10, 10)
+                self.assertEqual(cv.coords(item)[:2], [x + 10, y + 10])
+                spin_box.lower()
+                self.assertIs(cv.widgets[0], spin_box)
+                self.assertIs(cv.widgets[-1], button)
+                spin_box.lift()
+                self.assertIs(cv.widgets[-1], spin_box.widgets[-1])
+                self.assertEqual(cv.find_all()[-1], cv.find_withtag(spin_box.tag)[-1])
+
+    def test_untagged_items(self) -> None:
+        with containers.Tk() as tk:
+            with containers.Canvas(tk) as cv:
+                button = widgets.Button(cv, (0, 0), (100, 40))
+                item = cv.create_rectangle(0, 0, 10, 10)
+                button.texts[0].items.append(item)
+                button.move(10, 10)
+                self.assertEqual(cv.coords(item), [10, 10, 20, 20])
+                button.zoom((2, 2))
+                self.assertEqual(cv.coords(item), [20, 20, 40, 40])
+
     def test_register_event(self) -> None:
         with containers.Tk() as tk:
             with containers.Canvas(tk) as cv:
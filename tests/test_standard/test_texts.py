@@ -0,0 +1,110 @@
+# pylint: disable=all
+
+import itertools
+import random
+import tkinter.font
+import unittest
+
+from maliang.core import containers
+from maliang.standard import texts, widgets
+
+
+class TestCanvasTextProxy(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.tk = containers.Tk()
+        self.cv = containers.Canvas(self.tk)
+        self.font = tkinter.font.Font(self.cv, family="Courier", size=-16)
+        self.item = self.cv.create_text(0, 0, text="hello", font=self.font)
+        self.proxy = texts._CanvasTextProxy(self.cv, self.item)
+
+    def tearDown(self) -> None:
+        self.tk.destroy()
+
+    def assert_prefix_widths(self) -> None:
+        self.assertEqual(self.proxy._get_prefix_widths(), list(itertools.accumulate(
+            (self.font.measure(char) for char in self.proxy.get()), initial=0)))
+
+    def test_measure(self) -> None:
+        self.assertEqual(self.proxy.measure("ab"), [self.font.measure("a"), self.font.measure("b")])
+        self.assertEqual(self.proxy.width(), sum(self.proxy.measure("hello")))
+
+    def test_prefix_widths(self) -> None:
+        self.assert_prefix_widths()
+        self.proxy.insert(2, "XYZ")
+        self.assertEqual(self.proxy.get(), "heXYZllo")
+        self.assert_prefix_widths()
+        self.proxy.remove(1, 4)
+        self.assertEqual(self.proxy.get(), "hZllo")
+        self.assert_prefix_widths()
+        self.proxy.set("ab")
+        self.assert_prefix_widths()
+        self.proxy.clear()
+        self.assertEqual(self.proxy.width(), 0)
+
+    def test_font_changed(self) -> None:
+        width = self.proxy.width()
+        self.font.config(size=-32)
+        self.assertNotEqual(self.proxy.width(), width)
+        self.assert_prefix_widths()
+
+
+class TestSingleLineText(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.tk = containers.Tk()
+        self.cv = containers.Canvas(self.tk)
+        self.text = widgets.InputBox(self.cv, (0, 0), (200, 40)).texts[0]
+
+    def tearDown(self) -> None:
+        self.tk.destroy()
+
+    def assert_filled(self) -> None:
+        text = self.text
+        self.assertEqual(text.text_proxy.get(), text.text[text.left:text.right])
+        self.assertFalse(text._is_overflow())
+        extra = text._get_margin()*2 + 2
+        width = text.text_proxy.width()
+        if text.right < len(text.text):
+            self.assertTrue(text._is_too_wide(width + text.text_proxy.measure(text.text[text.right])[0] + extra))
+        if text.left > 0:
+            self.assertTrue(text._is_too_wide(width + text.text_proxy.measure(text.text[text.left-1])[0] + extra))
+
+    def test_append(self) -> None:
+        self.text.append("abcdefghij"*10)
+        self.assertGreater(self.text.left, 0)
+        self.assertEqual(self.text.right, 100)
+        self.assert_filled()
+
+    def test_insert(self) -> None:
+        self.text.append("abcdefghij"*10)
+        self.text.insert(2, "W"*5)
+        self.assertEqual(self.text.get()[self.text.left+2:self.text.left+7], "W"*5)
+        self.assert_filled()
+
+    def test_remove(self) -> None:
+        self.text.append("abcdefghij"*10)
+        length = self.text.text_proxy.length()
+        self.text.remove(length - 5, length)
+        self.assertEqual(len(self.text.get()), 95)
+        self.assert_filled()
+        self.text.remove(0, 5)
+        self.assert_filled()
+        self.text.remove(0, self.text.text_proxy.length())
+        self.assert_filled()
+
+    def test_edits(self) -> None:
+        rand = random.Random(3)
+        for _ in range(200):
+            length = self.text.text_proxy.length()
+            if rand.random() < 0.5 or not length:
+                index = length if rand.random() < 0.5 else rand.randint(0, length)
+                self.text.insert(index, "".join(rand.choices("iWm. ", k=rand.choice([1, 2, 20]))))
+            else:
+                start = rand.randint(0, length - 1)
+                self.text.remove(start, rand.randint(start, length))
+            self.assert_filled()
+
+
+if __name__ == "__main__":
+    unittest.main()
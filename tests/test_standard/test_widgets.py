@@ -0,0 +1,180 @@
+# pylint: disable=all
+
+import pathlib
+import time
+import tkinter
+import unittest
+import unittest.mock
+
+from maliang.core import containers
+from maliang.standard import widgets
+from maliang.toolbox import enhanced
+
+
+class TestImage(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.tk = containers.Tk()
+        self.cv = containers.Canvas(self.tk)
+
+    def tearDown(self) -> None:
+        self.tk.destroy()
+
+    def test_load_before_configure(self) -> None:
+        self.assertFalse(hasattr(self.cv, "ratios"))
+        image = widgets.Image(self.cv, (0, 0))
+        placeholder = enhanced.PhotoImage.transparent(4, 4)
+        file = pathlib.Path(__file__).parent.parent/"assets/images/logo.png"
+        future = image.images[0].load(file, placeholder=placeholder)
+        self.assertIs(image.images[0].initail_image, placeholder)
+        for _ in range(500):
+            if image.images[0].initail_image is not placeholder:
+                break
+            self.tk.update()
+            time.sleep(0.01)
+        self.assertTrue(future.done())
+        self.assertIsNot(image.images[0].initail_image, placeholder)
+
+
+class TestTextBox(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.tk = containers.Tk()
+        self.cv = containers.Canvas(self.tk)
+        self.lines = [f"line {i}" for i in range(100)]
+        self.box = widgets.TextBox(self.cv, (0, 0), (400, 300), text="\n".join(self.lines))
+        self.text = self.box.texts[0]
+        self.linespace = self.text.font.metrics("linespace")
+        self.x = self.text.position[0] + self.text.padding
+        self.y = self.text.position[1] + self.text.padding
+
+    def tearDown(self) -> None:
+        self.tk.destroy()
+
+    def shown(self) -> list[str]:
+        return [self.cv.itemcget(item, "text") for item in self.text.items]
+
+    def click(self, row: int) -> unittest.mock.Mock:
+        event = tkinter.Event()
+        event.x, event.y = self.x + 300, self.y + self.linespace*(row + 0.5)
+        with unittest.mock.patch.object(self.cv.trigger_focus, "update") as update:
+            self.box.feature._button_1(event)
+        return update
+
+    def press(self, keysym: str, char: str = "") -> None:
+        event = tkinter.Event()
+        event.keysym, event.char = keysym, char
+        self.box.feature._key_press(event)
+
+    def test_render(self) -> None:
+        rows = len(self.text.items)
+        self.assertGreater(rows, 1)
+        self.assertEqual(self.shown(), self.lines[:rows])
+        self.box.set("a\nb")
+        self.assertEqual(self.shown(), ["a", "b"] + [""]*(rows-2))
+
+    def test_scroll(self) -> None:
+        rows = len(self.text.items)
+        self.text.scroll(10)
+        self.assertEqual(self.text.top, 10)
+        self.assertEqual(self.shown(), self.lines[10:10+rows])
+        self.text.scroll(-100)
+        self.assertEqual(self.text.top, 0)
+        self.text.scroll(1000)
+        self.assertEqual(self.text.top, 100 - rows)
+        self.assertEqual(self.shown()[-1], "line 99")
+        self.text.see(self.text.table.index(5, 0))
+        self.assertEqual(self.text.top, 5)
+
+    def test_cursor_find(self) -> None:
+        index = self.text.table.index
+        self.assertEqual(self.text.cursor_find(self.x - 10, self.y + self.linespace*2.5), index(2, 0))
+        self.assertEqual(self.text.cursor_find(self.x + 1000, self.y + self.linespace*2.5), index(2, 6))
+        self.text.scroll(10)
+        self.assertEqual(self.text.cursor_find(self.x - 10, self.y + self.linespace*0.5), index(10, 0))
+        self.assertEqual(self.text.cursor_find(self.x - 10, self.y + 10000), index(9 + len(self.text.items), 0))
+
+    def test_edit(self) -> None:
+        self.box.insert(self.text.table.index(1, 4), "A\nB")
+        self.lines[1:2] = ["lineA", "B 1"]
+        self.assertEqual(self.box.get(), "\n".join(self.lines))
+        self.assertEqual(self.shown()[:3], self.lines[:3])
+        self.box.remove(self.text.table.index(0, 4), self.text.table.index(2, 1))
+        self.lines[0:3] = ["line 1"]
+        self.assertEqual(self.box.get(), "\n".join(self.lines))
+        self.assertEqual(self.shown()[:2], self.lines[:2])
+
+    def test_focus(self) -> None:
+        self.click(2).assert_called_once_with(True, self.text.items[2])
+        self.assertEqual(self.box.state, "active")
+        self.assertEqual(self.text.table.position(self.text.cursor_get()), (2, 6))
+        self.press("x", "x")
+        self.assertEqual(self.shown()[2], "line 2x")
+        self.press("Return", "\r")
+        self.assertEqual(self.shown()[2:5], ["line 2x", "", "line 3"])
+        self.assertEqual(self.text.table.position(self.text.cursor_get()), (3, 0))
+        self.text.scroll(10)
+        self.click(1).assert_called_once_with(True, self.text.items[1])
+        self.assertEqual(self.text.table.position(self.text.cursor_get())[0], 11)
+
+
+class TestVirtualList(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.tk = containers.Tk()
+        self.cv = containers.Canvas(self.tk)
+        self.clicked = []
+        self.rows = widgets.VirtualList(
+            self.cv, (0, 0), (200, 100), count=1000, row_height=20, padding=0,
+            source=lambda i: f"row {i}", command=self.clicked.append)
+
+    def tearDown(self) -> None:
+        self.tk.destroy()
+
+    def test_recycle(self) -> None:
+        self.assertEqual(len(self.rows.widgets), 5)
+        self.rows.scroll(10)
+        self.assertEqual(self.rows.top, 10)
+        self.assertEqual([row.get() for row in self.rows.widgets], [f"row {i}" for i in range(10, 15)])
+        self.rows.widgets[1].feature.command()
+        self.assertEqual(self.clicked, [11])
+
+    def test_scroll(self) -> None:
+        self.rows.scroll(-100)
+        self.assertEqual(self.rows.top, 0)
+        self.rows.scroll(10**6)
+        self.assertEqual(self.rows.top, 995)
+        self.assertEqual(self.rows.widgets[-1].get(), "row 999")
+
+    def test_see(self) -> None:
+        self.rows.see(500)
+        self.assertEqual(self.rows.top, 496)
+        self.assertEqual(self.rows.widgets[-1].get(), "row 500")
+        self.rows.see(3)
+        self.assertEqual(self.rows.top, 3)
+        self.assertEqual(self.rows.widgets[0].get(), "row 3")
+        self.rows.see(5)
+        self.assertEqual(self.rows.top, 3)
+
+    def test_zoom(self) -> None:
+        self.rows.zoom((2, 2))
+        self.assertEqual(self.rows.row_height, 40)
+        self.rows.scroll(10)
+        self.assertEqual([row.get() for row in self.rows.widgets], [f"row {i}" for i in range(10, 15)])
+        for i, row in enumerate(self.rows.widgets):
+            self.assertEqual(row.position[1], self.rows.position[1] + i*self.rows.row_height)
+            self.assertEqual(self.cv.coords(row.shapes[0].items[0])[1], self.cv.coords(self.rows.widgets[0].shapes[0].items[0])[1] + i*40)
+
+    def test_refresh(self) -> None:
+        self.rows.scroll(100)
+        self.rows.refresh(2)
+        self.assertEqual(self.rows.top, 0)
+        self.assertEqual(self.rows.widgets[1].get(), "row 1")
+        self.assertFalse(self.rows.widgets[1].disappeared)
+        self.assertTrue(self.rows.widgets[2].disappeared)
+        self.rows.refresh(1000)
+        self.assertFalse(self.rows.widgets[2].disappeared)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,6 +2,7 @@
 
 import importlib
 import pathlib
+import time
 import unittest
 import unittest.mock
 
@@ -39,6 +40,10 @@ class TestPhotoImage(unittest.TestCase):
         self.assertEqual(new_width, 100)
         self.assertEqual(new_height, 100)
 
+    def test_transparent(self) -> None:
+        image = enhanced.PhotoImage.transparent(20, 10)
+        self.assertEqual((image.width(), image.height()), (20, 10))
+
 
 class TestPhotoImageNoPillow(unittest.TestCase):
 
@@ -75,6 +80,109 @@ class TestPhotoImageNoPillow(unittest.TestCase):
         self.assertEqual(new_width, 100)
         self.assertEqual(new_height, 100)
 
+    def test_transparent(self) -> None:
+        image = enhanced.PhotoImage.transparent(20, 10)
+        self.assertEqual((image.width(), image.height()), (20, 10))
+
+
+class TestImageCache(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.tk = containers.Tk()
+        self.image = enhanced.PhotoImage(width=10, height=10)
+
+    def tearDown(self) -> None:
+        self.tk.destroy()
+
+    def test_resize(self) -> None:
+        cache = enhanced.ImageCache(max_bytes=20*20*4)
+        image = cache.resize(self.image, 20, 20)
+        self.assertIs(cache.scale(self.image, 2, 2), image)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        cache.resize(self.image, 5, 5)
+        self.assertEqual(cache.evicted_bytes, 20*20*4)
+        self.assertEqual(cache.bytes, 5*5*4)
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
+
+class TestFontRegistry(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.tk = containers.Tk()
+
+    def tearDown(self) -> None:
+        self.tk.destroy()
+
+    def test_registry(self) -> None:
+        registry = enhanced.FontRegistry()
+        font = registry.acquire(self.tk, "Arial", -20)
+        self.assertIs(registry.acquire(self.tk, "Arial", -20), font)
+        registry.scale(font, 1.5)
+        self.assertEqual(font.cget("size"), -30)
+        bold_font = registry.replace(font, weight="bold")
+        self.assertIsNot(bold_font, font)
+        self.assertEqual(font.cget("weight"), "normal")
+        self.assertIs(registry.replace(bold_font, size=-10), bold_font)
+        self.assertEqual(bold_font.cget("size"), -10)
+        self.assertEqual(len(registry), 2)
+        registry.release(font)
+        self.assertEqual(len(registry), 1)
+        registry.clear(self.tk)
+        self.assertEqual(len(registry), 0)
+
+
+class TestLoadImageAsync(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.tk = containers.Tk()
+
+    def tearDown(self) -> None:
+        self.tk.destroy()
+
+    def test_load_image_async(self) -> None:
+        images = []
+        file = pathlib.Path(__file__).parent.parent/"assets/images/logo.png"
+        enhanced.load_image_async(file, (20, 10), images.append)
+        enhanced.load_image_async(file, callback=images.append)
+        for _ in range(500):
+            if len(images) == 2:
+                break
+            self.tk.update()
+            time.sleep(0.01)
+        self.assertEqual(sorted((image.width(), image.height()) for image in images)[0], (20, 10))
+        self.assertEqual(enhanced._pending[self.tk], 0)
+
+    def test_destroyed_master(self) -> None:
+        images = []
+        file = pathlib.Path(__file__).parent.parent/"assets/images/logo.png"
+        cv = containers.Canvas(self.tk)
+        enhanced.load_image_async(file, callback=images.append, master=cv)
+        cv.destroy()
+        enhanced.load_image_async(file, callback=images.append)
+        for _ in range(500):
+            if len(images) == 2:
+                break
+            self.tk.update()
+            time.sleep(0.01)
+        self.assertEqual(len(images), 2)
+        self.tk.destroy()
+        self.assertNotIn(self.tk, enhanced._pending)
+        self.tk = containers.Tk()
+
+
+class TestResampling(unittest.TestCase):
+
+    def test_get_factors(self) -> None:
+        self.assertEqual(enhanced._get_factors(100, 150), (3, 2))
+        self.assertEqual(enhanced._get_factors(101, 51), (1, 2))
+        self.assertEqual(enhanced._get_factors(100, 200), (2, 1))
+        self.assertIsNone(enhanced._get_factors(512, 517))
+
+    def test_get_runs(self) -> None:
+        self.assertEqual(enhanced._get_runs(2, 4), [[0, 0, 2], [1, 2, 4]])
+        self.assertEqual(enhanced._get_runs(4, 2), [[0, 0, 1], [2, 1, 2]])
+
 
 if __name__ == "__main__":
     unittest.main()
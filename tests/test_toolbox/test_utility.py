@@ -39,6 +39,64 @@ class TestTrigger(unittest.TestCase):
         self.assertTrue(self.t.get())
 
 
+class TestSpatialIndex(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.index = utility.SpatialIndex(10, max_cells=16)
+
+    def test_insert_and_query(self) -> None:
+        a, b = object(), object()
+        self.index.insert(a, (0, 0, 5, 5))
+        self.index.insert(b, (15, 15, 25, 25))
+        self.assertEqual(self.index.query(1, 1), {a})
+        self.assertEqual(self.index.query(21, 21), {b})
+        self.assertEqual(self.index.query(50, 50), set())
+        self.assertEqual(len(self.index), 2)
+
+    def test_update_and_remove(self) -> None:
+        a = object()
+        self.index.insert(a, (0, 0, 5, 5))
+        self.index.insert(a, (30, 30, 35, 35))
+        self.assertEqual(self.index.query(1, 1), set())
+        self.assertEqual(self.index.query(31, 31), {a})
+        self.index.remove(a)
+        self.assertNotIn(a, self.index)
+        self.assertEqual(self.index.query(31, 31), set())
+        self.assertEqual(self.index._cells, {})
+
+    def test_large_pinned_and_active(self) -> None:
+        a, b, c = object(), object(), object()
+        self.index.insert(a, (0, 0, 1000, 1000))
+        self.index.pin(b)
+        self.index.active = {c}
+        self.assertEqual(self.index.query(-500, 500), {a, b, c})
+        self.index.clear()
+        self.assertEqual(self.index.query(0, 0), set())
+
+
+class TestPieceTable(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.table = utility.PieceTable("ab\ncd\nef")
+
+    def test_insert_and_delete(self) -> None:
+        self.table.insert(3, "XY\n")
+        self.assertEqual(str(self.table), "ab\nXY\ncd\nef")
+        self.assertEqual(self.table.line_count, 4)
+        self.table.delete(1, 6)
+        self.assertEqual(str(self.table), "acd\nef")
+        self.assertEqual(len(self.table), 6)
+        self.assertEqual(self.table.get(1, 3), "cd")
+        self.assertEqual(self.table.line_count, 2)
+
+    def test_lines_and_positions(self) -> None:
+        self.assertEqual(self.table.get_lines(1, 3), ["cd", "ef"])
+        self.assertEqual(self.table.index(2, 1), 7)
+        self.assertRaises(IndexError, self.table.index, 9)
+        self.assertEqual(self.table.position(4), (1, 1))
+        self.assertEqual(self.table.position(8), (2, 2))
+
+
 class TestCase(unittest.TestCase):
 
     def setUp(self) -> None:
@@ -88,6 +146,22 @@ class TestCase(unittest.TestCase):
         widget = maliang.Button(self.cv, (0, 0))
         self.assertEqual(utility.get_text_size("", 20, "Fira Code", master=widget), (2, 24))
 
+    def test_get_text_sizes(self) -> None:
+        texts = ["", ":)", "\n", "ab\nc"]
+        sizes = utility.get_text_sizes(texts, 20, configs.Font.family, padding=1, master=self.cv)
+        for text, size in zip(texts, sizes):
+            item = self.cv.create_text(0, 0, text=text, font=(configs.Font.family, 20))
+            x1, y1, x2, y2 = self.cv.bbox(item)
+            self.assertEqual(size, (x2 - x1 + 2, y2 - y1 + 2))
+
+    def test_text_size_cache(self) -> None:
+        size = utility.get_text_size("cache", master=self.cv)
+        self.assertIn(self.tk, utility._fonts)
+        self.tk.destroy()
+        self.assertNotIn(self.tk, utility._fonts)
+        self.tk = containers.Tk()
+        self.assertEqual(utility.get_text_size("cache", master=self.tk), size)
+
     def test_fix_cursor(self) -> None:
         self.assertEqual(utility.fix_cursor("a"), "a")
 